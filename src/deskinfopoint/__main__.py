@@ -7,26 +7,27 @@ import os
 import sys
 from pathlib import Path
 
-from .config import ConfigError, load_config
-from .app import App
-
 _LOCK_PATH = "/tmp/deskinfopoint.lock"
+_lock_fd: int | None = None   # held open so the flock lasts until exit
+
 
+def _acquire_lock() -> None:
+    """Hold an exclusive flock on _LOCK_PATH and write our PID into it.
 
-def _acquire_lock():
-    """Open and exclusively lock _LOCK_PATH.  Returns the open file object
-    (must stay alive for the duration of the process — the OS releases the
-    lock automatically when the file descriptor is closed or the process exits).
+    The kernel releases the lock when the process exits for any reason
+    (including SIGKILL or power loss), so a leftover file is never stale and
+    needs no cleanup.  The PID is written once, after the lock is held.
+    The descriptor is kept open in _lock_fd for the life of the process.
     Exits with a clear error if another instance already holds the lock.
     """
-    # Open without truncating so the existing PID is readable on lock failure.
-    lock_file = open(_LOCK_PATH, "a+")
+    global _lock_fd
+    # No O_TRUNC: on failure the holder's PID must still be readable.
+    fd = os.open(_LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
     try:
-        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
     except OSError:
-        lock_file.seek(0)
-        pid = lock_file.read().strip()
-        lock_file.close()
+        pid = os.read(fd, 32).decode(errors="replace").strip()
+        os.close(fd)
         pid_info = f" (PID {pid})" if pid else ""
         print(
             f"deskinfopoint is already running{pid_info}.\n"
@@ -34,12 +35,9 @@ def _acquire_lock():
             file=sys.stderr,
         )
         sys.exit(1)
-    # Lock acquired — write our PID.
-    lock_file.seek(0)
-    lock_file.truncate()
-    lock_file.write(str(os.getpid()))
-    lock_file.flush()
-    return lock_file
+    os.ftruncate(fd, 0)
+    os.write(fd, str(os.getpid()).encode())
+    _lock_fd = fd
 
 
 def main() -> None:
@@ -63,6 +61,10 @@ def main() -> None:
         datefmt="%H:%M:%S",
     )
 
+    # Imported only after argparse so --help and bad arguments exit without
+    # paying for YAML, PIL, paho and the display driver.
+    from .config import ConfigError, load_config
+
     try:
         config = load_config(args.config)
     except FileNotFoundError:
@@ -72,8 +74,10 @@ def main() -> None:
         print(f"Config error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    _lock = _acquire_lock()  # noqa: F841 — kept alive to hold the OS lock
+    _acquire_lock()
     state_file = str(Path(args.config).resolve().parent / "state.json")
+
+    from .app import App   # heavy: pulls in hardware drivers, PIL and every screen
     App(config, state_file).run()
 
 
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
+import dataclasses
 import operator as op_module
+from collections.abc import Callable, Mapping
+from typing import Any
 
-from .config import AlertConfig
+from .config import OP_EQ, OP_GE, OP_GT, OP_LE, OP_LT, AlertConfig
 from .state import SharedState, SensorReading
 
-_OPS: dict[str, Any] = {
-    ">=": op_module.ge,
-    "<=": op_module.le,
-    "!=": op_module.ne,
-    ">":  op_module.gt,
-    "<":  op_module.lt,
-    "==": op_module.eq,
-}
+_ORDERING_CODES = frozenset({OP_GT, OP_GE, OP_LT, OP_LE})
 
-# Satisfy the type checker; op_module returns bool
-from typing import Any
+_SENSOR_FIELDS = frozenset(f.name for f in dataclasses.fields(SensorReading))
+
+# (sensor reading, mqtt values) → resolved value or None
+_Resolver = Callable[[SensorReading, Mapping[str, Any]], Any]
+
+
+def _compile_resolver(ns: str, field: str) -> _Resolver:
+    """Turn a split alert source like ("sensor", "co2") into a lookup function."""
+    if ns == "sensor" and field in _SENSOR_FIELDS:
+        get_field = op_module.attrgetter(field)
+        return lambda sensor, mqtt_vals: get_field(sensor)
+    if ns == "mqtt":
+        return lambda sensor, mqtt_vals: mqtt_vals.get(field)
+    return lambda sensor, mqtt_vals: None
 
 
 class AlertEvaluator:
@@ -23,39 +31,53 @@ class AlertEvaluator:
 
     Alerts are sorted by priority (descending) at construction time.
     The first matching alert is returned — highest priority wins.
+
+    Source lookup is resolved once per alert at construction.  Alerts
+    sharing a source (e.g. several CO2 thresholds) share one resolver, so
+    each source is looked up once per evaluation.  The comparison is an
+    if/elif ladder on AlertConfig.op_code rather than an operator lookup.
+    Ordering comparisons (<, >, …) only run when the value has the same
+    kind as the threshold (number vs string); == and != compare anything.
     """
 
-    def __init__(self, alerts: list[AlertConfig], state: SharedState) -> None:
-        self._alerts = sorted(alerts, key=lambda a: a.priority, reverse=True)
+    def __init__(self, alerts: tuple[AlertConfig, ...], state: SharedState) -> None:
         self._state = state
+        self._resolvers: list[_Resolver] = []
+        source_index: dict[str, int] = {}
+        # (config, index into self._resolvers, required value type or None, op code, threshold)
+        self._compiled: list[
+            tuple[AlertConfig, int, type | tuple[type, ...] | None, int, Any]
+        ] = []
+        for alert in sorted(alerts, key=lambda a: a.priority, reverse=True):
+            idx = source_index.get(alert.source)
+            if idx is None:
+                idx = source_index[alert.source] = len(self._resolvers)
+                self._resolvers.append(_compile_resolver(alert.source_ns, alert.source_field))
+            kind: type | tuple[type, ...] | None = None
+            if alert.op_code in _ORDERING_CODES:
+                kind = (int, float) if isinstance(alert.threshold, float) else str
+            self._compiled.append((alert, idx, kind, alert.op_code, alert.threshold))
 
     def active_alert(self) -> AlertConfig | None:
         sensor = self._state.get_sensor()
         mqtt_vals = self._state.get_all_mqtt()
-        for alert in self._alerts:
-            value = self._resolve(alert.source, sensor, mqtt_vals)
-            if value is not None and self._eval(value, alert.op, alert.threshold):
+        values = [resolve(sensor, mqtt_vals) for resolve in self._resolvers]
+        for alert, idx, kind, code, t in self._compiled:
+            v = values[idx]
+            if v is None or (kind is not None and not isinstance(v, kind)):
+                continue
+            if code == OP_GT:
+                hit = v > t
+            elif code == OP_GE:
+                hit = v >= t
+            elif code == OP_LT:
+                hit = v < t
+            elif code == OP_LE:
+                hit = v <= t
+            elif code == OP_EQ:
+                hit = v == t
+            else:  # OP_NE
+                hit = v != t
+            if hit:
                 return alert
         return None
-
-    def _resolve(
-        self,
-        source: str,
-        sensor: SensorReading,
-        mqtt_vals: dict[str, Any],
-    ) -> Any:
-        ns, _, field = source.partition(".")
-        if ns == "sensor":
-            return getattr(sensor, field, None)
-        if ns == "mqtt":
-            return mqtt_vals.get(field)
-        return None
-
-    def _eval(self, value: Any, op_str: str, threshold: Any) -> bool:
-        fn = _OPS.get(op_str)
-        if fn is None:
-            return False
-        try:
-            return bool(fn(value, threshold))
-        except TypeError:
-            return False
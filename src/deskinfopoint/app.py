@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import importlib
 import logging
+import os
 import signal
 import threading
+from typing import TYPE_CHECKING
 
 from displayhatmini_lite import DisplayHATMini  # type: ignore[import-untyped]
 
@@ -14,29 +17,60 @@ from .hardware.led import LEDController
 from .ha_prefetch import prefetch as ha_prefetch
 from .mqtt_client import MQTTClient
 from . import persistence
-from .screens.base import Screen
-from .screens.mixed_screen import MixedScreen
-from .screens.mqtt_screen import MQTTScreen
-from .screens.sensor_screen import SensorScreen
+from .screens.base import Screen, preload_fonts
 from .screens.settings_screen import SettingsScreen
-from .sensors.scd30 import SCD30Sensor
 from .state import SharedState
 
+if TYPE_CHECKING:
+    from .sensors.scd30 import SCD30Sensor
+
 logger = logging.getLogger(__name__)
 
+# Screen type → (module, class name, constructor takes subs_by_id).
+# Modules are imported on first use so a config only pays for the screens it uses.
+_SCREEN_TYPES: dict[str, tuple[str, str, bool]] = {
+    "sensor": (".screens.sensor_screen", "SensorScreen", False),
+    "mqtt": (".screens.mqtt_screen", "MQTTScreen", True),
+    "mixed": (".screens.mixed_screen", "MixedScreen", True),
+}
+_screen_classes: dict[str, type[Screen]] = {}
+
+
+def _screen_class(screen_type: str) -> type[Screen]:
+    cls = _screen_classes.get(screen_type)
+    if cls is None:
+        module, name, _ = _SCREEN_TYPES[screen_type]
+        cls = getattr(importlib.import_module(module, __package__), name)
+        _screen_classes[screen_type] = cls
+    return cls
+
+
+def _uses_sensor(config: AppConfig) -> bool:
+    """True if any screen, alert, or the publish topic needs SCD-30 readings."""
+    if config.sensor.publish_topic:
+        return True
+    if any(a.source_ns == "sensor" for a in config.alerts):
+        return True
+    for sc in config.screens:
+        if sc.type == "sensor":
+            return True
+        if sc.type == "mixed" and any(getattr(it, "source", "") for it in sc.items):
+            return True
+    return False
+
 
 def _build_screens(
-    screen_configs: list[ScreenConfig],
+    screen_configs: tuple[ScreenConfig, ...],
     subs_by_id: dict[str, SubscriptionConfig],
 ) -> list[Screen]:
     screens: list[Screen] = []
     for cfg in screen_configs:
-        if cfg.type == "sensor":
-            screens.append(SensorScreen(cfg))
-        elif cfg.type == "mqtt":
-            screens.append(MQTTScreen(cfg, subs_by_id))
-        elif cfg.type == "mixed":
-            screens.append(MixedScreen(cfg, subs_by_id))
+        if cfg.type in _SCREEN_TYPES:
+            cls = _screen_class(cfg.type)
+            if _SCREEN_TYPES[cfg.type][2]:
+                screens.append(cls(cfg, subs_by_id))  # type: ignore[call-arg]
+            else:
+                screens.append(cls(cfg))  # type: ignore[call-arg]
         elif cfg.type in ("brightness", "led_brightness"):
             logger.warning(
                 "Screen type %r is deprecated; brightness is now in the Settings screen (press A).",
@@ -55,8 +89,7 @@ class App:
         self._state_file = state_file
         self._shutdown = threading.Event()
 
-        subs_by_id = {s.id: s for s in config.subscriptions}
-        screens = _build_screens(config.screens, subs_by_id)
+        screens = _build_screens(config.screens, config.subs_by_id)
         if not screens:
             raise RuntimeError("No valid screens were built from configuration")
 
@@ -82,13 +115,19 @@ class App:
         self._display_hw.set_backlight(initial_brightness)
 
         self._mqtt = MQTTClient(config.mqtt, config.subscriptions, self._state)
-        self._sensor = SCD30Sensor(config.sensor, self._state, self._shutdown, self._mqtt)
+        self._sensor: SCD30Sensor | None = None
+        if _uses_sensor(config):
+            from .sensors.scd30 import SCD30Sensor
+            self._sensor = SCD30Sensor(config.sensor, self._state, self._shutdown, self._mqtt)
+        else:
+            logger.info("No screen, alert or publish topic uses the SCD-30; sensor not started")
 
         evaluator = AlertEvaluator(config.alerts, self._state)
         self._led = LEDController(
             self._display_hw, evaluator, config.led_idle, self._state, self._shutdown
         )
         settings_screen = SettingsScreen()
+        preload_fonts(set().union(*(sc.fonts() for sc in (*screens, settings_screen))))
         self._renderer = DisplayController(
             self._display_hw, screens, self._state, config.display.fps,
             self._shutdown, settings_screen,
@@ -96,6 +135,7 @@ class App:
         self._buttons = ButtonHandler(
             self._display_hw, config.buttons, self._state, self._mqtt, self._shutdown,
         )
+        self._persist = persistence.PersistenceWriter(state_file, self._state, self._shutdown)
 
     def run(self) -> None:
         signal.signal(signal.SIGINT, self._handle_signal)
@@ -103,55 +143,36 @@ class App:
 
         logger.info("Starting deskinfopoint")
         self._mqtt.start()
-        self._sensor.start()
+        if self._sensor:
+            self._sensor.start()
         if self._config.ha:
-            ha_prefetch(self._config.ha, self._config.subscriptions, self._state)
+            ha_cache = os.path.join(os.path.dirname(self._state_file), "ha_cache.json")
+            ha_prefetch(self._config.ha, self._config.subscriptions, self._state, ha_cache)
         self._led.start()
         self._renderer.start()
         self._buttons.start()
 
-        # Watcher: save screen + brightness whenever either changes (≈1 Hz poll).
-        watcher = threading.Thread(target=self._persist_watcher, name="persist", daemon=True)
-        watcher.start()
+        self._persist.start()
 
         self._shutdown.wait()  # main thread blocks here until signal
 
         logger.info("Shutdown: stopping subsystems")
         self._buttons.join()
+        self._persist.join()
         self._renderer.join()
         self._led.join()
-        self._sensor.join()
+        if self._sensor:
+            self._sensor.join()
         self._mqtt.stop()
         self._display_hw.set_led(0.0, 0.0, 0.0)
         self._display_hw.set_backlight(0.0)
 
         # Final save so a clean shutdown always captures the latest state.
-        persistence.save(
-            self._state_file,
-            self._state.get_current_screen(),
-            self._state.get_brightness(),
-            self._state.get_led_brightness(),
-        )
+        screen, brightness, led_brightness, _ = self._state.snapshot_persistable()
+        persistence.save(self._state_file, screen, brightness, led_brightness, fsync=True)
         logger.info("Shutdown complete")
 
-    def _persist_watcher(self) -> None:
-        """Daemon thread: saves state whenever screen, brightness, or LED brightness changes."""
-        last = (
-            self._state.get_current_screen(),
-            self._state.get_brightness(),
-            self._state.get_led_brightness(),
-        )
-        while not self._shutdown.is_set():
-            self._shutdown.wait(timeout=1.0)
-            current = (
-                self._state.get_current_screen(),
-                self._state.get_brightness(),
-                self._state.get_led_brightness(),
-            )
-            if current != last:
-                persistence.save(self._state_file, current[0], current[1], current[2])
-                last = current
-
     def _handle_signal(self, signum: int, frame: object) -> None:
         logger.info("Received signal %d", signum)
         self._shutdown.set()
+        self._state.wake_waiters()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import os
+import pickle
 import re
 from dataclasses import dataclass, field
 from datetime import time as Time
@@ -7,6 +10,13 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
 
 class ConfigError(ValueError):
     pass
@@ -18,17 +28,27 @@ class ConfigError(ValueError):
 # ---------------------------------------------------------------------------
 _OP_PATTERN = re.compile(r"^(>=|<=|!=|>|<|==)\s*(.+)$")
 
+# Integer codes for the comparison operators, resolved once per AlertConfig
+# so the alert hot loop branches on an int instead of dispatching on a string.
+OP_GT, OP_GE, OP_LT, OP_LE, OP_EQ, OP_NE = range(6)
+_OP_CODES: dict[str, int] = {
+    ">": OP_GT, ">=": OP_GE, "<": OP_LT, "<=": OP_LE, "==": OP_EQ, "!=": OP_NE,
+}
+
 
 def _parse_condition(s: str) -> tuple[str, float | str]:
     m = _OP_PATTERN.match(s.strip())
     if not m:
         raise ConfigError(f"Cannot parse condition {s!r}. Expected e.g. '> 1000' or \"== 'ON'\"")
     op, raw = m.group(1), m.group(2).strip()
-    # Try numeric first
-    try:
-        return op, float(raw)
-    except ValueError:
-        pass
+    # Numeric thresholds start with a digit, sign or point, or are inf/nan
+    # (which float() accepts too); only those are tried as floats, so most
+    # string thresholds never take the exception path.
+    if raw[0].isdigit() or raw[0] in "+-.iInN":
+        try:
+            return op, float(raw)
+        except ValueError:
+            pass
     # Strip surrounding quotes for string comparisons
     if len(raw) >= 2 and raw[0] in ("'", '"') and raw[-1] == raw[0]:
         return op, raw[1:-1]
@@ -39,13 +59,14 @@ def _parse_condition(s: str) -> tuple[str, float | str]:
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HaConfig:
     url: str     # e.g. http://homeassistant.local:8123
     token: str   # Long-Lived Access Token
+    cache_ttl: int = 30   # seconds a cached prefetch result is reused across restarts; 0 = off
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MqttConfig:
     broker: str
     port: int = 1883
@@ -55,7 +76,7 @@ class MqttConfig:
     keepalive: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorConfig:
     measurement_interval: int = 5
     temperature_offset: float = 0.0
@@ -63,14 +84,14 @@ class SensorConfig:
     publish_topic: str = ""   # MQTT topic for JSON sensor readings; empty = disabled
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DisplayConfig:
     brightness: float = 1.0
     fps: int = 10
     backlight_pwm: bool = False   # True requires dtoverlay=pwm-2chan in config.txt
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubscriptionConfig:
     id: str
     topic: str
@@ -79,9 +100,15 @@ class SubscriptionConfig:
     value_path: str = ""
     entity_id: str = ""   # HA entity id for startup prefetch (e.g. sensor.lumi_temp4_temperature_2)
     value_map: dict[str, str] = field(default_factory=dict)  # map raw MQTT values to display strings
+    # Derived once at construction: "a.0.b" → ("a", "0", "b"); "" → ()
+    path_parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        parts = tuple(self.value_path.split(".")) if self.value_path else ()
+        object.__setattr__(self, "path_parts", parts)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorItem:
     label: str
     source: str   # "co2" | "temperature" | "humidity"
@@ -89,13 +116,13 @@ class SensorItem:
     format: str = "{}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MqttItem:
     subscription_id: str
     format: str = "{}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MixedItem:
     """Item for a 'mixed' screen — either a sensor source or an MQTT subscription."""
     source: str = ""           # "co2" | "temperature" | "humidity"
@@ -105,21 +132,21 @@ class MixedItem:
     format: str = "{}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScreenConfig:
     name: str
     type: str   # "sensor" | "mqtt" | "mixed" | "brightness" | "led_brightness"
-    items: list[SensorItem | MqttItem | MixedItem] = field(default_factory=list)
+    items: tuple[SensorItem | MqttItem | MixedItem, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ButtonConfig:
     action: str   # "prev_screen" | "next_screen" | "mqtt_publish"
     topic: str = ""
     payload: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AlertConfig:
     source: str
     op: str
@@ -129,33 +156,47 @@ class AlertConfig:
     blink_hz: float = 2.0
     pulse_hz: float = 1.0
     priority: int = 0
-
-
-@dataclass
+    # Derived once at construction: "sensor.co2" → ("sensor", "co2"); op → OP_* code
+    source_ns: str = field(init=False, repr=False, compare=False)
+    source_field: str = field(init=False, repr=False, compare=False)
+    op_code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        code = _OP_CODES.get(self.op)
+        if code is None:
+            raise ConfigError(f"Unknown alert operator {self.op!r}")
+        object.__setattr__(self, "op_code", code)
+        ns, _, fld = self.source.partition(".")
+        object.__setattr__(self, "source_ns", ns)
+        object.__setattr__(self, "source_field", fld)
+
+
+@dataclass(frozen=True, slots=True)
 class LedIdleConfig:
     color: tuple[float, float, float] = (0.0, 0.0, 0.0)
     mode: str = "solid"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NightModeConfig:
     start: Time   # local wall-clock time sleep begins
     end: Time     # local wall-clock time sleep ends (may be next day)
     wake_duration: int = 30   # seconds display + LED stay on after a button press
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     mqtt: MqttConfig
     sensor: SensorConfig
     display: DisplayConfig
-    subscriptions: list[SubscriptionConfig]
-    screens: list[ScreenConfig]
+    subscriptions: tuple[SubscriptionConfig, ...]
+    screens: tuple[ScreenConfig, ...]
     buttons: dict[str, ButtonConfig]
-    alerts: list[AlertConfig]
+    alerts: tuple[AlertConfig, ...]
     led_idle: LedIdleConfig
     ha: HaConfig | None = None
     night_mode: NightModeConfig | None = None
+    subs_by_id: dict[str, SubscriptionConfig] = field(default_factory=dict)  # built by load_config
 
 
 # ---------------------------------------------------------------------------
@@ -182,10 +223,68 @@ def _color(raw: list, context: str) -> tuple[float, float, float]:
     return (float(raw[0]), float(raw[1]), float(raw[2]))
 
 
+# ---------------------------------------------------------------------------
+# Parsed-config cache
+# The parsed AppConfig is pickled to a sidecar file next to the YAML and
+# reused while the YAML's (mtime, size) is unchanged.  This module's own
+# mtime is part of the key so a code update never loads stale dataclasses.
+# ---------------------------------------------------------------------------
+
+def _cache_key(path: str) -> tuple[int, int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, os.stat(__file__).st_mtime_ns)
+
+
+def _read_cache(cache_path: str, key: tuple[int, int, int]) -> AppConfig | None:
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, config = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,   # cached class layout no longer matches the code
+        ImportError,
+        ValueError,       # truncated or foreign pickle, wrong tuple shape
+        TypeError,
+    ) as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+        return None
+    if cached_key != key or not isinstance(config, AppConfig):
+        return None
+    return config
+
+
+def _write_cache(cache_path: str, key: tuple[int, int, int], config: AppConfig) -> None:
+    """Atomically write the cache; failures (e.g. read-only dir) are not fatal."""
+    tmp = cache_path + ".tmp"
+    try:
+        # 0o600: the cache holds the same secrets (MQTT password, HA token) as the YAML.
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
+
 def load_config(path: str) -> AppConfig:
+    """Load *path*, reusing the sidecar ``<path>.cache`` when the YAML is unchanged."""
+    key = _cache_key(path)   # raises FileNotFoundError for a missing config
+    cache_path = path + ".cache"
+    config = _read_cache(cache_path, key)
+    if config is None:
+        config = _parse_config(path)
+        _write_cache(cache_path, key, config)
+    return config
+
+
+def _parse_config(path: str) -> AppConfig:
     try:
         with open(path) as f:
-            raw = yaml.safe_load(f)
+            raw = yaml.load(f, Loader=_SafeLoader)
     except FileNotFoundError:
         raise
     except yaml.YAMLError as e:
@@ -201,6 +300,7 @@ def load_config(path: str) -> AppConfig:
         ha = HaConfig(
             url=_require(h, "url", "ha").rstrip("/"),
             token=_require(h, "token", "ha"),
+            cache_ttl=int(h.get("cache_ttl", 30)),
         )
 
     # --- mqtt ---
@@ -251,7 +351,7 @@ def load_config(path: str) -> AppConfig:
     screens: list[ScreenConfig] = []
     for i, sc in enumerate(raw.get("screens", [])):
         sc_type = _require(sc, "type", f"screens[{i}]")
-        items: list[SensorItem | MqttItem] = []
+        items: list[SensorItem | MqttItem | MixedItem] = []
         for j, item in enumerate(sc.get("items", [])):
             ctx = f"screens[{i}].items[{j}]"
             if sc_type == "sensor":
@@ -287,7 +387,7 @@ def load_config(path: str) -> AppConfig:
         screens.append(ScreenConfig(
             name=_require(sc, "name", f"screens[{i}]"),
             type=sc_type,
-            items=items,
+            items=tuple(items),
         ))
 
     if not screens:
@@ -342,11 +442,12 @@ def load_config(path: str) -> AppConfig:
         mqtt=mqtt,
         sensor=sensor,
         display=display,
-        subscriptions=subscriptions,
-        screens=screens,
+        subscriptions=tuple(subscriptions),
+        screens=tuple(screens),
         buttons=buttons,
-        alerts=alerts,
+        alerts=tuple(alerts),
         led_idle=led_idle,
         ha=ha,
         night_mode=night_mode,
+        subs_by_id={sub.id: sub for sub in subscriptions},
     )
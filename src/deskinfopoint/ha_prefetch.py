@@ -2,19 +2,119 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
 
 from .config import HaConfig, SubscriptionConfig
 from .state import SharedState
 
 logger = logging.getLogger(__name__)
 
+_MAX_WORKERS = 8
+_BATCH_MIN = 3   # fetch all states in one /api/states request from this many entities up
 
-def prefetch(ha: HaConfig, subscriptions: list[SubscriptionConfig], state: SharedState) -> None:
+
+def _request(ha: HaConfig, path: str):
+    req = urllib.request.Request(
+        f"{ha.url}{path}", headers={"Authorization": f"Bearer {ha.token}"}
+    )
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def _coerce(entity_id: str, raw: str) -> float | str | None:
+    """Convert an HA state string to float if possible; None for unusable states."""
+    if raw in ("unknown", "unavailable"):
+        logger.debug("HA prefetch: %s is %s — skipping", entity_id, raw)
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return raw
+
+
+def _fetch_one(ha: HaConfig, sub: SubscriptionConfig) -> float | str | None:
+    """Fetch one entity state.  Returns None on any failure or unusable state."""
+    try:
+        raw = str(_request(ha, f"/api/states/{sub.entity_id}")["state"])
+    except urllib.error.URLError as e:
+        logger.warning("HA prefetch failed for %s: %s", sub.entity_id, e)
+        return None
+    except (KeyError, json.JSONDecodeError) as e:
+        logger.warning("HA prefetch: unexpected response for %s: %s", sub.entity_id, e)
+        return None
+    return _coerce(sub.entity_id, raw)
+
+
+def _fetch_all(ha: HaConfig) -> dict[str, str] | None:
+    """Fetch every entity state in one request.  Returns None on failure."""
+    try:
+        data = _request(ha, "/api/states")
+        return {str(e["entity_id"]): str(e["state"]) for e in data}
+    except urllib.error.URLError as e:
+        logger.warning("HA bulk prefetch failed (%s); falling back to per-entity requests", e)
+    except (KeyError, TypeError, json.JSONDecodeError) as e:
+        logger.warning("HA bulk prefetch: unexpected response (%s); falling back", e)
+    return None
+
+
+def _load_cache(path: str) -> dict[str, dict]:
+    """Load {entity_id: {"state": value, "ts": wall-clock seconds}}.  {} on any error."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:   # ValueError covers bad JSON and bad UTF-8
+        logger.warning("Could not read HA cache %s: %s", path, e)
+    return {}
+
+
+def _save_cache(path: str, cache: dict[str, dict]) -> None:
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning("Could not save HA cache %s: %s", path, e)
+
+
+def _fresh_entry(entry: object, now: float, ttl: int) -> bool:
+    """True if *entry* is a well-formed cache entry younger than *ttl* seconds.
+
+    The file is only checked to be a JSON object, so each entry is
+    validated here.  A timestamp in the future (the Pi has no RTC, so NTP
+    can move the clock backwards past it after boot) counts as stale.
+    """
+    if not isinstance(entry, dict) or "state" not in entry:
+        return False
+    ts = entry.get("ts")
+    if not isinstance(ts, (int, float)) or isinstance(ts, bool):
+        return False
+    return 0 <= now - ts < ttl
+
+
+def prefetch(
+    ha: HaConfig,
+    subscriptions: tuple[SubscriptionConfig, ...],
+    state: SharedState,
+    cache_path: str | None = None,
+) -> None:
     """Seed SharedState with current HA entity states before the first render.
 
     Called once at startup for every subscription that has entity_id set.
+    Entities fetched less than ha.cache_ttl seconds ago (per *cache_path*)
+    are restored from disk.  From _BATCH_MIN entities up the rest come from
+    a single /api/states request; otherwise (or if that fails) they are
+    requested concurrently, so startup waits for the slowest entity rather
+    than the sum of all of them.
     Failures are logged as warnings and never crash the app — MQTT will
     populate the values when the next sensor update arrives.
     """
@@ -22,26 +122,51 @@ def prefetch(ha: HaConfig, subscriptions: list[SubscriptionConfig], state: Share
     if not eligible:
         return
 
-    logger.info("Prefetching %d HA state(s) from %s", len(eligible), ha.url)
+    use_cache = cache_path is not None and ha.cache_ttl > 0
+    cache = _load_cache(cache_path) if use_cache else {}
+    now = time.time()
+    values: dict[str, Any] = {}   # subscription id → value, stored in one batch
+    to_fetch: list[SubscriptionConfig] = []
     for sub in eligible:
-        url = f"{ha.url}/api/states/{sub.entity_id}"
-        req = urllib.request.Request(
-            url, headers={"Authorization": f"Bearer {ha.token}"}
-        )
-        try:
-            with urllib.request.urlopen(req, timeout=5) as resp:
-                data = json.loads(resp.read())
-            raw = str(data["state"])
-            if raw in ("unknown", "unavailable"):
-                logger.debug("HA prefetch: %s is %s — skipping", sub.entity_id, raw)
+        entry = cache.get(sub.entity_id)
+        if _fresh_entry(entry, now, ha.cache_ttl):
+            values[sub.id] = entry["state"]
+            logger.debug("HA prefetch: %s → %s = %r (cached)", sub.entity_id, sub.id, entry["state"])
+        else:
+            to_fetch.append(sub)
+    if not to_fetch:
+        state.update_mqtt_many(values)
+        logger.info("HA prefetch: all %d state(s) restored from cache", len(eligible))
+        return
+
+    logger.info("Prefetching %d HA state(s) from %s", len(to_fetch), ha.url)
+    fetched = False
+
+    def apply(sub: SubscriptionConfig, value: float | str | None) -> None:
+        nonlocal fetched
+        if value is None:
+            return
+        values[sub.id] = value
+        cache[sub.entity_id] = {"state": value, "ts": now}
+        fetched = True
+        logger.info("HA prefetch: %s → %s = %r", sub.entity_id, sub.id, value)
+
+    all_states = _fetch_all(ha) if len(to_fetch) >= _BATCH_MIN else None
+    if all_states is not None:
+        for sub in to_fetch:
+            raw = all_states.get(sub.entity_id)
+            if raw is None:
+                logger.warning("HA prefetch: entity %s not found", sub.entity_id)
                 continue
-            try:
-                value: float | str = float(raw)
-            except ValueError:
-                value = raw
-            state.update_mqtt(sub.id, value)
-            logger.info("HA prefetch: %s → %s = %r", sub.entity_id, sub.id, value)
-        except urllib.error.URLError as e:
-            logger.warning("HA prefetch failed for %s: %s", sub.entity_id, e)
-        except (KeyError, json.JSONDecodeError) as e:
-            logger.warning("HA prefetch: unexpected response for %s: %s", sub.entity_id, e)
+            apply(sub, _coerce(sub.entity_id, raw))
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_WORKERS, len(to_fetch)), thread_name_prefix="ha-prefetch"
+        ) as ex:
+            futures = {ex.submit(_fetch_one, ha, sub): sub for sub in to_fetch}
+            for fut in as_completed(futures):
+                apply(futures[fut], fut.result())
+
+    state.update_mqtt_many(values)
+    if use_cache and fetched:
+        _save_cache(cache_path, cache)  # type: ignore[arg-type]
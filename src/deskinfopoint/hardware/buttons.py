@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from displayhatmini_lite import DisplayHATMini  # type: ignore[import-untyped]
@@ -25,10 +26,15 @@ _BUTTON_PINS: dict[str, int] = {
 _POLL_INTERVAL = 0.05   # 50 ms — responsive enough, low CPU overhead
 _DEBOUNCE_COUNT = 2     # require N consecutive identical reads before acting
 _LOCKOUT = 0.2          # seconds: after any press, ignore all other buttons
+_GPIO_CHIP = "/dev/gpiochip0"
+_EDGE_WAIT = 0.5        # seconds: edge-event wait between shutdown checks
 
 
 class ButtonHandler:
-    """Polls button states and dispatches mode-aware actions.
+    """Reads button presses and dispatches mode-aware actions.
+
+    Presses come from kernel GPIO edge events when libgpiod v2 is installed,
+    otherwise from polling the display library every _POLL_INTERVAL.
 
     Button layout (physical):
       A (top-left)     B (bottom-left)
@@ -66,42 +72,101 @@ class ButtonHandler:
         self._state = state
         self._mqtt = mqtt
         self._shutdown = shutdown
+        self._pins: tuple[tuple[str, int], ...] = tuple(_BUTTON_PINS.items())
         self._thread = threading.Thread(
             target=self._run, name="buttons", daemon=False
         )
 
     def start(self) -> None:
         self._thread.start()
-        logger.info("Button polling started")
 
     def join(self) -> None:
         self._thread.join()
 
     def _run(self) -> None:
-        prev_state: dict[str, bool] = {name: False for name in _BUTTON_PINS}
-        stable_state: dict[str, bool] = {name: False for name in _BUTTON_PINS}
-        counts: dict[str, int] = {name: 0 for name in _BUTTON_PINS}
+        if not self._run_edge_events():
+            self._run_polling()
+
+    def _run_edge_events(self) -> bool:
+        """Wait for kernel edge events on the GPIO character device (libgpiod v2).
+
+        Sleeps in poll() until a button changes, so the thread costs nothing
+        while idle.  Debouncing is done by the kernel over the same window
+        the polling loop uses.  Returns False without handling any presses
+        if gpiod is unavailable or the lines cannot be requested, so the
+        caller can fall back to polling.
+        """
+        try:
+            import gpiod  # type: ignore[import-untyped]
+            from gpiod.line import Bias, Direction, Edge  # type: ignore[import-untyped]
+        except ImportError:
+            logger.debug("gpiod v2 not available; using button polling")
+            return False
+
+        names_by_pin = {pin: name for name, pin in _BUTTON_PINS.items()}
+        settings = gpiod.LineSettings(
+            direction=Direction.INPUT,
+            edge_detection=Edge.RISING,   # press, since lines are active-low
+            bias=Bias.PULL_UP,
+            active_low=True,
+            debounce_period=timedelta(seconds=_POLL_INTERVAL * _DEBOUNCE_COUNT),
+        )
+        try:
+            request = gpiod.request_lines(
+                _GPIO_CHIP,
+                consumer="deskinfopoint",
+                config={tuple(names_by_pin): settings},
+            )
+        except (OSError, ValueError) as e:
+            logger.info("GPIO edge events unavailable (%s); using button polling", e)
+            return False
+
+        logger.info("Button edge detection started")
+        last_press_ns = -(10 ** 18)
+        lockout_ns = int(_LOCKOUT * 1e9)
+        with request:
+            while not self._shutdown.is_set():
+                if not request.wait_edge_events(timedelta(seconds=_EDGE_WAIT)):
+                    continue
+                for event in request.read_edge_events():
+                    if event.timestamp_ns - last_press_ns < lockout_ns:
+                        continue
+                    last_press_ns = event.timestamp_ns
+                    self._on_press(names_by_pin[event.line_offset])
+
+        logger.info("Button edge detection stopped")
+        return True
+
+    def _run_polling(self) -> None:
+        logger.info("Button polling started")
+        # Per-button state indexed like self._pins: last read, debounced state,
+        # consecutive identical reads (capped so it never overflows a byte).
+        n = len(self._pins)
+        prev_state = bytearray(n)
+        stable_state = bytearray(n)
+        counts = bytearray(n)
         last_press_time: float = 0.0
 
         while not self._shutdown.is_set():
-            for name, pin in _BUTTON_PINS.items():
+            for i, (name, pin) in enumerate(self._pins):
                 pressed = self._display.read_button(pin)
-                if pressed == prev_state[name]:
-                    counts[name] += 1
+                if pressed == prev_state[i]:
+                    if counts[i] <= _DEBOUNCE_COUNT:
+                        counts[i] += 1
                 else:
-                    counts[name] = 1
-                    prev_state[name] = pressed
+                    counts[i] = 1
+                    prev_state[i] = pressed
 
-                if counts[name] == _DEBOUNCE_COUNT:
-                    if pressed and not stable_state[name]:
+                if counts[i] == _DEBOUNCE_COUNT:
+                    if pressed and not stable_state[i]:
                         now = time.monotonic()
                         if now - last_press_time >= _LOCKOUT:
                             self._on_press(name)
                             last_press_time = now
-                            for other in counts:
-                                if other != name:
-                                    counts[other] = 0
-                    stable_state[name] = pressed
+                            for j in range(n):
+                                if j != i:
+                                    counts[j] = 0
+                    stable_state[i] = pressed
 
             self._shutdown.wait(timeout=_POLL_INTERVAL)
 
@@ -3,12 +3,52 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections import deque
+from collections.abc import Callable
 
-from ..screens.base import Screen
+from PIL import Image  # type: ignore[import-untyped]
+
+from ..screens.base import HEIGHT, WIDTH, Screen
 from ..state import NavMode, SharedState
 
 logger = logging.getLogger(__name__)
 
+_POOL_SIZE = 2   # frame buffers; display() is synchronous, so two is plenty
+_IDLE_WAIT = 1.0   # seconds: longest sleep between night-mode/shutdown checks
+
+
+def _frame_pusher(display) -> Callable[[Image.Image], None]:
+    """Return a function that sends one 320×240 RGB frame to *display*.
+
+    DisplayHATMini.display() hands the frame to luma's st7789 driver, which
+    rotates it 180° with rotate(expand=True) + crop, copies it with
+    convert("RGB"), and expands the pixel bytes into a Python list of
+    230 400 ints before the SPI write.  When the wrapped luma device is
+    reachable, the frame is instead flipped with a single transpose and its
+    RGB888 bytes (the panel runs in 18-bit COLMOD, three bytes per pixel)
+    go straight to the device's data() call.  Anything unexpected falls
+    back to display.display().
+    """
+    device = getattr(display, "_device", None)
+    if (
+        device is None
+        or getattr(device, "mode", None) != "RGB"
+        or getattr(device, "size", None) != (WIDTH, HEIGHT)
+        or getattr(device, "rotate", None) not in (0, 2)
+        or not hasattr(device, "set_window")
+        or not hasattr(device, "data")
+    ):
+        return display.display
+
+    flip = device.rotate == 2
+
+    def push(image: Image.Image) -> None:
+        frame = image.transpose(Image.Transpose.ROTATE_180) if flip else image
+        device.set_window(0, 0, WIDTH, HEIGHT)
+        device.data(frame.tobytes())
+
+    return push
+
 
 class DisplayController:
     """Render loop: picks the active screen, renders it, pushes to display.
@@ -16,8 +56,15 @@ class DisplayController:
     In DATA mode the current data screen is rendered.
     In SETTINGS or EDIT mode the settings screen is rendered instead.
 
-    Runs in its own thread.  Frame timing uses shutdown_event.wait() so it
-    responds to the shutdown signal immediately rather than after a full frame.
+    Runs in its own thread.  While nothing changes it sleeps on
+    SharedState.wait_change() instead of waking every frame, so an idle
+    display costs about one wakeup a second.  After a frame is pushed it
+    waits out the rest of the frame time on shutdown_event, which caps the
+    frame rate at fps and coalesces bursts of updates into one frame.
+    Pacing uses integer monotonic_ns deadlines, so it does not drift.
+
+    Frames are drawn into a small pool of preallocated images that rotate,
+    so steady-state rendering allocates no 320×240 buffers.
     """
 
     def __init__(
@@ -32,9 +79,13 @@ class DisplayController:
         self._display = display
         self._screens = screens
         self._state = state
-        self._frame_time = 1.0 / max(1, fps)
+        self._frame_ns = 1_000_000_000 // max(1, fps)
         self._shutdown = shutdown
         self._settings_screen = settings_screen
+        self._push = _frame_pusher(display)
+        self._pool: deque[Image.Image] = deque(
+            Image.new("RGB", (WIDTH, HEIGHT)) for _ in range(_POOL_SIZE)
+        )
         self._thread = threading.Thread(
             target=self._run, name="render", daemon=False
         )
@@ -46,8 +97,10 @@ class DisplayController:
         self._thread.join()
 
     def _run(self) -> None:
-        logger.info("Display render loop started (%.0f FPS)", 1.0 / self._frame_time)
+        logger.info("Display render loop started (%.0f FPS)", 1e9 / self._frame_ns)
         last_version = -1
+        next_frame_ns = 0   # monotonic_ns before which the next frame may not start
+        last_pushed: tuple[Screen, object] | None = None   # (screen, content signature)
         last_minute = -1
         last_brightness: float = self._state.get_brightness()
         was_sleeping = False
@@ -63,43 +116,57 @@ class DisplayController:
                 else:
                     self._display.set_backlight(self._state.get_brightness())
                     last_version = -1
+                    last_pushed = None
                     logger.info("Night mode: display on")
 
             if sleeping:
                 self._shutdown.wait(timeout=1.0)
                 continue
 
-            # Apply brightness changes immediately (e.g. confirmed from settings).
-            brightness = self._state.get_brightness()
-            if brightness != last_brightness:
-                self._display.set_backlight(brightness)
-                last_brightness = brightness
-
             # Force re-render when the minute changes so the clock stays current.
             current_minute = time.localtime().tm_min
             if current_minute != last_minute:
                 last_minute = current_minute
                 last_version = -1
 
-            version = self._state.get_version()
-            if version != last_version:
-                t0 = time.monotonic()
-                nav_mode = self._state.get_nav_mode()
-                if nav_mode != NavMode.DATA:
+            if self._state.get_version() != last_version:
+                # One lock acquisition for everything this frame reads.
+                snap = self._state.snapshot()
+
+                # Apply brightness changes immediately (e.g. confirmed from settings).
+                if snap.brightness != last_brightness:
+                    self._display.set_backlight(snap.brightness)
+                    last_brightness = snap.brightness
+
+                # Frame starts are paced on an integer deadline so back-to-back
+                # updates run at exactly fps; after an idle spell or a slow frame
+                # the schedule restarts from this frame.
+                next_frame_ns = max(next_frame_ns, time.monotonic_ns()) + self._frame_ns
+                if snap.nav_mode != NavMode.DATA:
                     screen = self._settings_screen
                 else:
-                    idx = self._state.get_current_screen()
-                    screen = self._screens[idx]
+                    screen = self._screens[snap.current_screen]
                 try:
-                    image = screen.render(self._state)
-                    self._display.display(image)
-                    last_version = version
+                    # Skip the render and the SPI push when nothing visible changed
+                    # (e.g. an MQTT update that formats to the same text).
+                    sig = screen.content_signature(snap)
+                    if sig is None or last_pushed != (screen, sig):
+                        target = self._pool[0]
+                        self._pool.rotate(-1)
+                        image = screen.render(snap, target)
+                        self._push(image)
+                        last_pushed = (screen, sig) if sig is not None else None
+                    last_version = snap.version
                 except Exception:
                     logger.exception("Render error on screen %s", screen.name)
-                elapsed = time.monotonic() - t0
-                sleep_time = max(0.0, self._frame_time - elapsed)
+                remaining_ns = next_frame_ns - time.monotonic_ns()
+                if remaining_ns > 0:
+                    self._shutdown.wait(timeout=remaining_ns / 1e9)
             else:
-                sleep_time = self._frame_time
-            self._shutdown.wait(timeout=sleep_time)
+                # Sleep until something changes, the minute rolls over, or it is
+                # time to re-check night mode and shutdown.
+                self._state.wait_change(
+                    last_version, timeout=min(_IDLE_WAIT, 60.0 - time.time() % 60.0)
+                )
 
         logger.info("Display render loop stopped")
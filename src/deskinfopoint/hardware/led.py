@@ -11,7 +11,16 @@ from ..state import SharedState
 logger = logging.getLogger(__name__)
 
 _TICK = 0.05        # 20 Hz — smooth enough for pulse/blink animation
-_TICK_SOLID = 0.5   # 2 Hz — sufficient to detect alert transitions when LED is steady
+# Solid LED: longest wait for a state change before re-evaluating.  Kept at
+# a second so shutdown is noticed promptly even if wake_waiters() could not
+# take the state lock (see SharedState.wake_waiters).
+_TICK_SOLID = 1.0
+_SOLID_TICKS = round(_TICK_SOLID / _TICK)   # animation ticks a solid wait stands for
+
+_WAVE_N = 128   # samples per waveform period; must be a power of two
+_PULSE_TABLE = tuple(
+    (math.sin(2 * math.pi * i / _WAVE_N) + 1.0) / 2.0 for i in range(_WAVE_N)
+)
 
 
 class LEDController:
@@ -19,6 +28,10 @@ class LEDController:
 
     Runs in its own thread so animation doesn't block the render loop.
     Evaluates alerts at each tick; the highest-priority active alert wins.
+    A solid colour is re-evaluated only when SharedState changes (or every
+    _TICK_SOLID), since nothing else can change the active alert.
+    Animation time is an integer tick count; pulse and blink index one
+    _WAVE_N-sample period (_PULSE_TABLE / its first half) by phase.
     """
 
     def __init__(
@@ -45,10 +58,11 @@ class LEDController:
         self._thread.join()
 
     def _run(self) -> None:
-        t = 0.0
+        ticks = 0
         _last_solid_rgb: tuple[float, float, float] | None = None
         _was_sleeping = False
         while not self._shutdown.is_set():
+            version = self._state.get_version()
             sleeping = self._state.is_night_sleeping()
             if sleeping != _was_sleeping:
                 _was_sleeping = sleeping
@@ -72,24 +86,24 @@ class LEDController:
             if mode == "blink":
                 _last_solid_rgb = None
                 hz = getattr(cfg, "blink_hz", 2.0)
-                on = (t * hz) % 1.0 < 0.5
+                on = (int(ticks * _TICK * hz * _WAVE_N) & (_WAVE_N - 1)) < _WAVE_N // 2
                 self._display.set_led(r * on, g * on, b * on)
                 self._shutdown.wait(timeout=_TICK)
-                t += _TICK
+                ticks += 1
             elif mode == "pulse":
                 _last_solid_rgb = None
                 hz = getattr(cfg, "pulse_hz", 1.0)
-                brightness = (math.sin(2 * math.pi * hz * t) + 1.0) / 2.0
+                brightness = _PULSE_TABLE[int(ticks * _TICK * hz * _WAVE_N) & (_WAVE_N - 1)]
                 self._display.set_led(r * brightness, g * brightness, b * brightness)
                 self._shutdown.wait(timeout=_TICK)
-                t += _TICK
+                ticks += 1
             else:  # solid — set once on change, then sleep longer
                 rgb = (r, g, b)
                 if rgb != _last_solid_rgb:
                     self._display.set_led(r, g, b)
                     _last_solid_rgb = rgb
-                self._shutdown.wait(timeout=_TICK_SOLID)
-                t += _TICK_SOLID
+                self._state.wait_change(version, timeout=_TICK_SOLID)
+                ticks += _SOLID_TICKS
 
         self._display.set_led(0.0, 0.0, 0.0)
         logger.info("LED controller stopped")
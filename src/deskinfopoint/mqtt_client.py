@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 import paho.mqtt.client as mqtt
@@ -10,19 +11,65 @@ from paho.mqtt.enums import CallbackAPIVersion
 from .config import MqttConfig, SubscriptionConfig
 from .state import SharedState
 
+try:
+    import orjson  # type: ignore[import-not-found]
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_Accessor = Callable[[Any], Any]
+
+
+def _compile_path(path_parts: tuple[str, ...]) -> _Accessor | None:
+    """Turn a pre-split value_path into a function that walks parsed JSON.
+
+    Each part is an object key, or a list index when the value at that point
+    is a list (parts are converted to int once, here).  Returns None for an
+    empty path, i.e. a plain payload.
+    """
+    if not path_parts:
+        return None
+    steps: list[tuple[str, int | None]] = []
+    for key in path_parts:
+        try:
+            steps.append((key, int(key)))
+        except ValueError:
+            steps.append((key, None))   # only valid on objects; int(key) below raises for lists
+
+    if len(steps) == 1:
+        key, index = steps[0]
+
+        def access_one(data: Any) -> Any:
+            if isinstance(data, list):
+                return data[index if index is not None else int(key)]
+            return data[key]
+        return access_one
+
+    frozen_steps = tuple(steps)
+
+    def access(data: Any) -> Any:
+        for key, index in frozen_steps:
+            if isinstance(data, list):
+                data = data[index if index is not None else int(key)]
+            else:
+                data = data[key]
+        return data
+    return access
+
 
 class MQTTClient:
     def __init__(
         self,
         config: MqttConfig,
-        subscriptions: list[SubscriptionConfig],
+        subscriptions: tuple[SubscriptionConfig, ...],
         state: SharedState,
     ) -> None:
         self._config = config
-        self._subs_by_topic: dict[str, SubscriptionConfig] = {
-            s.topic: s for s in subscriptions
+        # topic → (subscription, compiled value_path accessor or None)
+        self._subs_by_topic: dict[str, tuple[SubscriptionConfig, _Accessor | None]] = {
+            s.topic: (s, _compile_path(s.path_parts)) for s in subscriptions
         }
         self._state = state
 
@@ -48,9 +95,12 @@ class MQTTClient:
         self._client.loop_stop()
         self._client.disconnect()
 
-    def publish(self, topic: str, payload: str) -> None:
-        """Publish a message. Thread-safe: paho queues it internally for the network thread."""
-        self._client.publish(topic, payload, qos=1)
+    def publish(self, topic: str, payload: str, qos: int = 1) -> None:
+        """Publish a message. Thread-safe: paho queues it internally for the network thread.
+
+        Use qos=0 for periodic telemetry where losing a sample is harmless.
+        """
+        self._client.publish(topic, payload, qos=qos)
         logger.info("Published %s → %r", topic, payload)
 
     # --- paho callbacks (run in paho's network thread) ---
@@ -65,12 +115,12 @@ class MQTTClient:
             logger.debug("Subscribed to %s", topic)
 
     def _on_message(self, client, userdata, message) -> None:
-        sub = self._subs_by_topic.get(message.topic)
-        if sub is None:
+        route = self._subs_by_topic.get(message.topic)
+        if route is None:
             return
+        sub, accessor = route
         try:
-            raw = message.payload.decode("utf-8", errors="replace")
-            value = self._extract_value(raw, sub.value_path)
+            value = self._extract_value(message.payload, accessor)
             self._state.update_mqtt(sub.id, value)
             logger.debug("MQTT %s → %s = %r", message.topic, sub.id, value)
         except Exception:
@@ -80,21 +130,25 @@ class MQTTClient:
         if reason_code.is_failure:
             logger.warning("MQTT disconnected unexpectedly (%s); will reconnect", reason_code)
 
-    def _extract_value(self, raw: str, value_path: str) -> Any:
-        """Return a float if possible, else str.  Traverses dot-notation JSON path."""
-        if not value_path:
-            raw = raw.strip()
+    def _extract_value(self, payload: bytes, accessor: _Accessor | None) -> Any:
+        """Return a float if possible, else str.  *accessor* walks the JSON path.
+
+        Works on the raw payload bytes: JSON is parsed straight from bytes
+        (with orjson when installed), and plain numbers go through float()
+        without decoding.  Only non-numeric plain payloads are decoded.
+        """
+        if accessor is None:
+            try:
+                return float(payload)
+            except ValueError:
+                pass
+            raw = payload.decode("utf-8", errors="replace").strip()
             try:
                 return float(raw)
             except ValueError:
                 return raw
 
-        data = json.loads(raw)
-        for key in value_path.split("."):
-            if isinstance(data, list):
-                data = data[int(key)]
-            else:
-                data = data[key]
+        data = accessor(_json_loads(payload))
         try:
             return float(data)
         except (ValueError, TypeError):
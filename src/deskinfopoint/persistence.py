@@ -3,9 +3,17 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .state import SharedState
 
 logger = logging.getLogger(__name__)
 
+_MIN_WRITE_INTERVAL = 0.5   # seconds between state-file writes; bursts are coalesced
+
 
 def load(path: str) -> dict:
     """Load persisted state from *path*.  Returns {} on missing file or any error."""
@@ -21,15 +29,79 @@ def load(path: str) -> dict:
     return {}
 
 
-def save(path: str, screen: int, brightness: float, led_brightness: float = 1.0) -> None:
-    """Atomically write screen index, brightness, and LED brightness to *path*."""
+def save(
+    path: str,
+    screen: int,
+    brightness: float,
+    led_brightness: float = 1.0,
+    fsync: bool = False,
+) -> None:
+    """Atomically write screen index, brightness, and LED brightness to *path*.
+
+    The JSON is written with a single write() to a temp file that then
+    replaces *path*, so a power cut leaves either the old or the new file.
+    Pass fsync=True to also flush it to the SD card before the rename
+    (used for the final save at shutdown).
+    """
     tmp = path + ".tmp"
+    data = json.dumps(
+        {"screen": screen, "brightness": brightness, "led_brightness": led_brightness},
+        separators=(",", ":"),
+    ).encode()
     try:
-        with open(tmp, "w") as f:
-            json.dump(
-                {"screen": screen, "brightness": brightness, "led_brightness": led_brightness},
-                f,
-            )
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(tmp, path)
     except Exception as e:
         logger.warning("Could not save state file %s: %s", path, e)
+
+
+class PersistenceWriter:
+    """Saves screen, brightness, and LED brightness whenever one changes.
+
+    Runs in its own thread so no button or render path ever touches the SD
+    card.  Sleeps on SharedState's persist condition, so it only wakes for a
+    real change (or once a second to notice shutdown).  Writes are skipped
+    when the rounded values match the last save, and spaced at least
+    _MIN_WRITE_INTERVAL apart so bursts coalesce into one write.
+
+    The thread is joined before the final save at shutdown, so the two never
+    write the temp file at the same time.
+    """
+
+    def __init__(self, path: str, state: SharedState, shutdown: threading.Event) -> None:
+        self._path = path
+        self._state = state
+        self._shutdown = shutdown
+        self._thread = threading.Thread(
+            target=self._run, name="persist", daemon=False
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def _run(self) -> None:
+        screen, brightness, led_brightness, last_version = self._state.snapshot_persistable()
+        last_saved = (screen, round(brightness, 2), round(led_brightness, 2))
+        last_write = 0.0
+        while not self._shutdown.is_set():
+            if self._state.wait_persist_change(last_version, timeout=1.0) == last_version:
+                continue
+            delay = last_write + _MIN_WRITE_INTERVAL - time.monotonic()
+            if delay > 0 and self._shutdown.wait(timeout=delay):
+                break   # the final save at shutdown covers this change
+            screen, brightness, led_brightness, last_version = self._state.snapshot_persistable()
+            current = (screen, round(brightness, 2), round(led_brightness, 2))
+            if current == last_saved:
+                continue
+            save(self._path, *current)
+            last_saved = current
+            last_write = time.monotonic()
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import os
+import re
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable
 from datetime import datetime
-from functools import lru_cache
+from functools import cache, lru_cache
 
 from PIL import Image, ImageDraw, ImageFont  # type: ignore[import-untyped]
 
-from ..state import SharedState
+from ..state import SharedState, StateSnapshot
 
 WIDTH = 320
 HEIGHT = 240
@@ -16,6 +18,7 @@ HEADER_H = 30
 DOTS_H = 14
 ITEMS_Y0 = HEADER_H + 2
 ITEMS_Y1 = HEIGHT - DOTS_H - 2
+_LABEL_GAP = 4   # px between a featured cell's label bottom and value top
 
 _FONT_DIRS = [
     "/usr/share/fonts/truetype/dejavu/",
@@ -24,19 +27,110 @@ _FONT_DIRS = [
 ]
 
 
-@lru_cache(maxsize=32)
-def load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
-    name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+@cache
+def _font_path(name: str) -> str | None:
+    """First existing path for font file *name* in _FONT_DIRS (probed once per name)."""
     for d in _FONT_DIRS:
         path = os.path.join(d, name)
         if os.path.exists(path):
-            try:
-                return ImageFont.truetype(path, size)
-            except OSError:
-                continue
+            return path
+    return None
+
+
+@lru_cache(maxsize=64)
+def load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    path = _font_path("DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf")
+    if path is not None:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            pass
     return ImageFont.load_default()
 
 
+def preload_fonts(fonts: Iterable[tuple[int, bool]]) -> None:
+    """Load each (size, bold) font now so the first frame of a screen doesn't stall on disk I/O."""
+    for size, bold in fonts:
+        load_font(size, bold)
+
+
+def cell_fonts(cells: Iterable[tuple[int, int, int, int, bool]]) -> set[tuple[int, bool]]:
+    """(size, bold) of the label, value and unit fonts _draw_item_value starts with per cell."""
+    fonts: set[tuple[int, bool]] = {(13, False)}
+    for _, y0, _, y1, featured in cells:
+        val_size = value_font_size(y1 - y0) if featured else min(value_font_size(y1 - y0), 36)
+        fonts.add((val_size, True))
+        fonts.add((max(13, val_size // 2), False))
+    return fonts
+
+
+_MEASURE = ImageDraw.Draw(Image.new("RGB", (1, 1)))   # scratch surface for text_width
+
+
+@lru_cache(maxsize=256)
+def text_width(size: int, bold: bool, text: str) -> int:
+    """Rendered width of *text* in load_font(size, bold), in whole pixels.
+
+    Cached: labels, hints and most values repeat frame after frame, and
+    FreeType layout is the most expensive part of drawing text.
+    """
+    return int(_MEASURE.textlength(text, font=load_font(size, bold)))
+
+
+@lru_cache(maxsize=64)
+def text_mask(size: int, bold: bool, text: str) -> tuple[Image.Image, int, int]:
+    """Antialiased coverage mask of *text*, plus its (dx, dy) offset from the origin.
+
+    For strings drawn every frame (units), so FreeType renders each one once.
+    """
+    font = load_font(size, bold)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask, left, top
+
+
+def draw_cached_text(
+    draw: ImageDraw.ImageDraw, xy: tuple[int, int], text: str, size: int, bold: bool, fill: str
+) -> None:
+    """Same pixels as draw.text(xy, text, font=load_font(size, bold), fill=fill), via text_mask."""
+    mask, dx, dy = text_mask(size, bold, text)
+    draw.bitmap((xy[0] + dx, xy[1] + dy), mask, fill=fill)
+
+
+_SINGLE_FIELD = re.compile(r"\{(?::([^{}]*))?\}")   # "{:.1f}", "{}" — one bare replacement field
+
+
+def compile_format(fmt: str) -> Callable[[object], str]:
+    """Return a function formatting one value with *fmt* ("---" for None).
+
+    The format string is parsed once here instead of on every frame.  The
+    common single-field case ("{:.1f}") becomes a direct format(value, spec)
+    call; anything else falls back to fmt.format().  Values the format
+    rejects are shown with str().
+    """
+    m = _SINGLE_FIELD.fullmatch(fmt)
+    if m is not None:
+        spec = m.group(1) or ""
+
+        def formatter(value: object) -> str:
+            if value is None:
+                return "---"
+            try:
+                return format(value, spec)
+            except (ValueError, TypeError):
+                return str(value)
+    else:
+        def formatter(value: object) -> str:
+            if value is None:
+                return "---"
+            try:
+                return fmt.format(value)
+            except (ValueError, TypeError):
+                return str(value)
+    return formatter
+
+
 def value_font_size(row_height: int) -> int:
     """Pick a value font size that comfortably fills the available row height."""
     if row_height >= 150:
@@ -148,12 +242,31 @@ def _draw_wifi_icon(
 class Screen(ABC):
     def __init__(self, name: str) -> None:
         self.name = name
+        self._bg_template: Image.Image | None = None
+        self._bg_key: Hashable = None
 
     @abstractmethod
-    def render(self, state: SharedState) -> Image.Image:
-        """Return a 320×240 RGB PIL Image."""
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        """Return a 320×240 RGB PIL Image.
+
+        If *target* (a 320×240 RGB image) is given the frame is drawn into it
+        and it is returned, so a caller can reuse buffers across frames.
+        """
         ...
 
+    def fonts(self) -> set[tuple[int, bool]]:
+        """(size, bold) pairs this screen draws with, for preload_fonts()."""
+        return {(14, True), (13, False)}   # header name, clock
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        """Hashable summary of everything a frame rendered now would show.
+
+        DisplayController skips rendering and pushing a frame whose
+        signature matches the last one pushed for this screen.  None (the
+        default) means "always render".
+        """
+        return None
+
     def handle_button(self, name: str, state: SharedState, display) -> bool:
         """Handle a button press before the global config is consulted.
 
@@ -162,6 +275,39 @@ class Screen(ABC):
         """
         return False
 
+    # --- Static background template ---
+
+    def _static_key(self, state: StateSnapshot) -> Hashable:
+        """Everything _draw_static depends on; the template is rebuilt when it changes."""
+        return (state.screen_count, state.current_screen)
+
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        """Draw the pixels that do not change between frames.
+
+        Subclasses extend this (calling super()) with their own chrome:
+        labels, separators, bar backgrounds, screen dots.
+        """
+        self._draw_header_bg(draw)
+
+    def _new_frame(
+        self, state: StateSnapshot, target: Image.Image | None = None
+    ) -> tuple[Image.Image, ImageDraw.ImageDraw]:
+        """Return a frame pre-filled with the cached static template.
+
+        Copies the template into *target* when given, else into a new image.
+        """
+        key = self._static_key(state)
+        if self._bg_template is None or key != self._bg_key:
+            template, draw = self._new_image()
+            self._draw_static(draw, state)
+            self._bg_template, self._bg_key = template, key
+        if target is None:
+            img = self._bg_template.copy()
+        else:
+            target.paste(self._bg_template)
+            img = target
+        return img, ImageDraw.Draw(img)
+
     # --- Shared drawing helpers ---
 
     def _new_image(self) -> tuple[Image.Image, ImageDraw.ImageDraw]:
@@ -169,16 +315,22 @@ class Screen(ABC):
         draw = ImageDraw.Draw(img)
         return img, draw
 
-    def _draw_header(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_header_bg(self, draw: ImageDraw.ImageDraw) -> None:
+        """Static part of the header: bar background and screen name."""
         draw.rectangle([0, 0, WIDTH - 1, HEADER_H - 1], fill="#141428")
         # Screen name (left)
         draw.text((10, 8), self.name, font=load_font(14, bold=True), fill="#dde6f0")
+
+    def _header_signature(self) -> tuple[str, bool]:
+        """What _draw_header_status would show: (clock text, Wi-Fi connected)."""
+        return (datetime.now().strftime("%H:%M"), _wifi_connected())
+
+    def _draw_header_status(self, draw: ImageDraw.ImageDraw) -> None:
+        """Per-frame part of the header: clock and Wi-Fi icon."""
         # Clock (right)
         clock_text = datetime.now().strftime("%H:%M")
-        clock_font = load_font(13)
-        clock_w = int(draw.textlength(clock_text, font=clock_font))
-        clock_x = WIDTH - 8 - clock_w
-        draw.text((clock_x, 9), clock_text, font=clock_font, fill="#7888a0")
+        clock_x = WIDTH - 8 - text_width(13, False, clock_text)
+        draw.text((clock_x, 9), clock_text, font=load_font(13), fill="#7888a0")
         # Wi-Fi icon (left of clock)
         icon_cx = clock_x - 8 - 8   # 8 px gap + half of 16 px icon
         _draw_wifi_icon(draw, icon_cx, HEADER_H - 3, _wifi_connected())
@@ -198,73 +350,98 @@ class Screen(ABC):
             color = "#ffffff" if i == current else "#3a3a3a"
             draw.ellipse([x - dot_r, y - dot_r, x + dot_r, y + dot_r], fill=color)
 
-    def _draw_item_cell(
+    def _draw_item_label(
         self,
         draw: ImageDraw.ImageDraw,
         x0: int, y0: int, x1: int, y1: int,
         featured: bool,
         label: str,
+    ) -> None:
+        """Draw an item's label into its cell rect (static; part of the template).
+
+        Featured cells: label centered above a vertically centered value block.
+        Grid cells: label centered at the top of the cell.
+        """
+        label_font = load_font(13)
+        cx = (x0 + x1) // 2
+        lbl_w = text_width(13, False, label)
+        if featured:
+            cell_h = y1 - y0
+            block_h = 13 + _LABEL_GAP + value_font_size(cell_h)
+            lbl_y = y0 + (cell_h - block_h) // 2
+        else:
+            lbl_y = y0 + 4
+        draw.text((cx - lbl_w // 2, lbl_y), label, font=label_font, fill="#a0b4c8")
+
+    def _draw_item_value(
+        self,
+        draw: ImageDraw.ImageDraw,
+        x0: int, y0: int, x1: int, y1: int,
+        featured: bool,
         text: str,
         unit: str,
         value_color: str,
     ) -> None:
-        """Draw a single item into its cell rect.
+        """Draw an item's value and unit into its cell rect (per frame).
 
-        Featured cells: label + value centered, large font.
-        Grid cells: label + value left-aligned, capped font size.
+        Featured cells: value + unit centered below the label, large font.
+        Grid cells: value + unit centered, font shrunk to fit the half-width column.
         """
         cell_h = y1 - y0
-        label_font = load_font(13)
+        cx = (x0 + x1) // 2
 
         if featured:
-            cx = (x0 + x1) // 2
             val_size = value_font_size(cell_h)
             val_font = load_font(val_size, bold=True)
-            unit_font = load_font(max(13, val_size // 2))
-            # Center label + value as a tight block vertically in the cell
-            lbl_gap = 4  # px between label bottom and value top
-            block_h = 13 + lbl_gap + val_size
+            unit_size = max(13, val_size // 2)
+            unit_font = load_font(unit_size)
+            # Same vertical block as _draw_item_label
+            block_h = 13 + _LABEL_GAP + val_size
             block_y = y0 + (cell_h - block_h) // 2
-            lbl_w = int(draw.textlength(label, font=label_font))
-            draw.text((cx - lbl_w // 2, block_y), label, font=label_font, fill="#a0b4c8")
             # Value + unit block centered horizontally
-            val_w = int(draw.textlength(text, font=val_font))
-            unit_w = int(draw.textlength(unit, font=unit_font)) if unit else 0
+            val_w = text_width(val_size, True, text)
+            unit_w = text_width(unit_size, False, unit) if unit else 0
             gap = 4 if unit else 0
             block_w = val_w + gap + unit_w
             val_x = cx - block_w // 2
-            val_y = block_y + 13 + lbl_gap
+            val_y = block_y + 13 + _LABEL_GAP
             draw.text((val_x, val_y), text, font=val_font, fill=value_color)
             if unit:
                 unit_y = val_y + val_size - int(unit_font.size) - 2
-                draw.text((val_x + val_w + gap, unit_y), unit, font=unit_font, fill="#a0b4c8")
+                draw_cached_text(
+                    draw, (val_x + val_w + gap, unit_y), unit, unit_size, False, "#a0b4c8"
+                )
         else:
-            # Grid cell: centered, auto-shrink value to fit half-width column
-            cx = (x0 + x1) // 2
             max_text_w = (x1 - x0) - 20  # 10px padding each side
             val_size = min(value_font_size(cell_h), 36)
-            val_font = load_font(val_size, bold=True)
-            unit_font = load_font(max(13, val_size // 2))
-            val_w = int(draw.textlength(text, font=val_font))
-            unit_w = int(draw.textlength(unit, font=unit_font)) if unit else 0
+            val_w = text_width(val_size, True, text)
+            unit_w = text_width(max(13, val_size // 2), False, unit) if unit else 0
             block_w = val_w + (4 if unit else 0) + unit_w
             # Shrink until value+unit fits
             while block_w > max_text_w and val_size > 14:
                 val_size -= 2
-                val_font = load_font(val_size, bold=True)
-                unit_font = load_font(max(13, val_size // 2))
-                val_w = int(draw.textlength(text, font=val_font))
-                unit_w = int(draw.textlength(unit, font=unit_font)) if unit else 0
+                val_w = text_width(val_size, True, text)
+                unit_w = text_width(max(13, val_size // 2), False, unit) if unit else 0
                 block_w = val_w + (4 if unit else 0) + unit_w
-            # Center label
-            lbl_w = int(draw.textlength(label, font=label_font))
-            draw.text((cx - lbl_w // 2, y0 + 4), label, font=label_font, fill="#a0b4c8")
+            val_font = load_font(val_size, bold=True)
+            unit_font = load_font(max(13, val_size // 2))
             # Center value+unit block
             val_x = cx - block_w // 2
             draw.text((val_x, y0 + 20), text, font=val_font, fill=value_color)
             if unit:
                 unit_y = y0 + 20 + val_size - int(unit_font.size) - 2
-                draw.text((val_x + val_w + 4, unit_y), unit, font=unit_font, fill="#a0b4c8")
+                draw_cached_text(
+                    draw, (val_x + val_w + 4, unit_y), unit,
+                    max(13, val_size // 2), False, "#a0b4c8",
+                )
+
+    def _draw_missing_subscription(
+        self, draw: ImageDraw.ImageDraw, x0: int, y0: int, sub_id: str
+    ) -> None:
+        """Red error tile for an item that references an undefined subscription."""
+        ef = load_font(13)
+        draw.text((x0 + 10, y0 + 4), sub_id, font=ef, fill="#ff4444")
+        draw.text((x0 + 10, y0 + 20), "no subscription", font=ef, fill="#ff4444")
 
     def _draw_cell_separators(
         self,
@@ -283,11 +460,3 @@ class Screen(ABC):
                 if key not in seen_vx:
                     draw.line([x0, y0, x0, y1 - 1], fill="#1e1e2e", width=1)
                     seen_vx.add(key)
-
-    def _format_value(self, value: object, fmt: str) -> str:
-        if value is None:
-            return "---"
-        try:
-            return fmt.format(value)
-        except (ValueError, TypeError):
-            return str(value)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
+
 from PIL import Image, ImageDraw
 
-from ..state import SharedState
-from .base import HEIGHT, WIDTH, Screen, load_font
+from ..state import SharedState, StateSnapshot
+from .base import HEIGHT, WIDTH, Screen, load_font, text_width
 
 _STEP = 0.1
 _BAR_X0 = 20
@@ -13,6 +15,18 @@ _BAR_Y1 = 172
 _BAR_W = _BAR_X1 - _BAR_X0
 
 
+def _make_ticks() -> Image.Image:
+    """Transparent bar-sized overlay with a tick mark at every 10% interval."""
+    overlay = Image.new("RGBA", (_BAR_W + 1, _BAR_Y1 - _BAR_Y0 + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    for x in (int(_BAR_W * i / 10) for i in range(1, 10)):
+        draw.line([x, 2, x, _BAR_Y1 - _BAR_Y0 - 2], fill="#0a0a0a", width=1)
+    return overlay
+
+
+_TICKS = _make_ticks()
+
+
 class BrightnessScreen(Screen):
     """Brightness control screen.
 
@@ -38,27 +52,48 @@ class BrightnessScreen(Screen):
             return True
         return False
 
-    def render(self, state: SharedState) -> Image.Image:
-        brightness = state.get_brightness()
-        pct = int(round(brightness * 100))
-
-        img, draw = self._new_image()
-        self._draw_header(draw)
-
-        # Large percentage value
-        val_font = load_font(80, bold=True)
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        super()._draw_static(draw, state)
         label_font = load_font(14)
         hint_font = load_font(15, bold=True)
 
-        val_text = f"{pct}%"
-        val_w = int(draw.textlength(val_text, font=val_font))
-        draw.text(((WIDTH - val_w) // 2, 38), val_text, font=val_font, fill="#f0f0f0")
-
         # Progress bar background
         draw.rounded_rectangle(
             [_BAR_X0, _BAR_Y0, _BAR_X1, _BAR_Y1],
             radius=6, fill="#2a2a2a",
         )
+
+        # Button hints
+        draw.text((10, 192), "X", font=hint_font, fill="#888888")
+        draw.text((30, 193), "dim", font=label_font, fill="#555555")
+
+        plus_label = "brighten"
+        plus_w = text_width(14, False, plus_label)
+        hint_w = text_width(15, True, "Y")
+        draw.text((WIDTH - 10 - plus_w - 6 - hint_w, 193), plus_label, font=label_font, fill="#555555")
+        draw.text((WIDTH - 10 - hint_w, 192), "Y", font=hint_font, fill="#888888")
+
+        self._draw_screen_dots(draw, state.screen_count, state.current_screen)
+
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | {(14, False), (15, True), (80, True)}
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        return (self._static_key(state), self._header_signature(), state.brightness)
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        brightness = state.brightness
+        pct = int(round(brightness * 100))
+
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
+
+        # Large percentage value
+        val_font = load_font(80, bold=True)
+        val_text = f"{pct}%"
+        val_w = text_width(80, True, val_text)
+        draw.text(((WIDTH - val_w) // 2, 38), val_text, font=val_font, fill="#f0f0f0")
+
         # Progress bar fill
         fill_w = int(_BAR_W * brightness)
         if fill_w > 0:
@@ -68,19 +103,6 @@ class BrightnessScreen(Screen):
             )
 
         # Tick marks at 10% intervals
-        for i in range(1, 10):
-            tx = _BAR_X0 + int(_BAR_W * i / 10)
-            draw.line([tx, _BAR_Y0 + 2, tx, _BAR_Y1 - 2], fill="#0a0a0a", width=1)
-
-        # Button hints
-        draw.text((10, 192), "X", font=hint_font, fill="#888888")
-        draw.text((30, 193), "dim", font=label_font, fill="#555555")
-
-        plus_label = "brighten"
-        plus_w = int(draw.textlength(plus_label, font=label_font))
-        hint_w = int(draw.textlength("Y", font=hint_font))
-        draw.text((WIDTH - 10 - plus_w - 6 - hint_w, 193), plus_label, font=label_font, fill="#555555")
-        draw.text((WIDTH - 10 - hint_w, 192), "Y", font=hint_font, fill="#888888")
+        img.paste(_TICKS, (_BAR_X0, _BAR_Y0), _TICKS)
 
-        self._draw_screen_dots(draw, state.get_screen_count(), state.get_current_screen())
         return img
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
+
 from PIL import Image, ImageDraw
 
-from ..state import SharedState
-from .base import HEIGHT, WIDTH, Screen, load_font
+from ..state import SharedState, StateSnapshot
+from .base import HEIGHT, WIDTH, Screen, load_font, text_width
 
 _LEVELS = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
 _BAR_X0 = 20
@@ -13,9 +15,21 @@ _BAR_Y1 = 172
 _BAR_W = _BAR_X1 - _BAR_X0
 
 
+def _make_ticks() -> Image.Image:
+    """Transparent bar-sized overlay with a tick mark at every inner level."""
+    overlay = Image.new("RGBA", (_BAR_W + 1, _BAR_Y1 - _BAR_Y0 + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    for x in (int(_BAR_W * lvl) for lvl in _LEVELS[1:-1]):
+        draw.line([x, 2, x, _BAR_Y1 - _BAR_Y0 - 2], fill="#0a0a0a", width=1)
+    return overlay
+
+
+_TICKS = _make_ticks()
+
+
 def _nearest_level(value: float) -> int:
-    """Return the index in _LEVELS closest to value."""
-    return min(range(len(_LEVELS)), key=lambda i: abs(_LEVELS[i] - value))
+    """Return the index in _LEVELS closest to value (levels are uniform 10% steps)."""
+    return max(0, min(len(_LEVELS) - 1, round(value * 10)))
 
 
 class LedBrightnessScreen(Screen):
@@ -41,27 +55,48 @@ class LedBrightnessScreen(Screen):
             return True
         return False
 
-    def render(self, state: SharedState) -> Image.Image:
-        brightness = state.get_led_brightness()
-        pct = int(round(brightness * 100))
-
-        img, draw = self._new_image()
-        self._draw_header(draw)
-
-        # Large percentage value
-        val_font = load_font(80, bold=True)
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        super()._draw_static(draw, state)
         label_font = load_font(14)
         hint_font = load_font(15, bold=True)
 
-        val_text = f"{pct}%"
-        val_w = int(draw.textlength(val_text, font=val_font))
-        draw.text(((WIDTH - val_w) // 2, 38), val_text, font=val_font, fill="#f0f0f0")
-
         # Progress bar background
         draw.rounded_rectangle(
             [_BAR_X0, _BAR_Y0, _BAR_X1, _BAR_Y1],
             radius=6, fill="#2a2a2a",
         )
+
+        # Button hints
+        draw.text((10, 192), "X", font=hint_font, fill="#888888")
+        draw.text((30, 193), "dim", font=label_font, fill="#555555")
+
+        plus_label = "brighten"
+        plus_w = text_width(14, False, plus_label)
+        hint_w = text_width(15, True, "Y")
+        draw.text((WIDTH - 10 - plus_w - 6 - hint_w, 193), plus_label, font=label_font, fill="#555555")
+        draw.text((WIDTH - 10 - hint_w, 192), "Y", font=hint_font, fill="#888888")
+
+        self._draw_screen_dots(draw, state.screen_count, state.current_screen)
+
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | {(14, False), (15, True), (80, True)}
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        return (self._static_key(state), self._header_signature(), state.led_brightness)
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        brightness = state.led_brightness
+        pct = int(round(brightness * 100))
+
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
+
+        # Large percentage value
+        val_font = load_font(80, bold=True)
+        val_text = f"{pct}%"
+        val_w = text_width(80, True, val_text)
+        draw.text(((WIDTH - val_w) // 2, 38), val_text, font=val_font, fill="#f0f0f0")
+
         # Progress bar fill
         fill_w = int(_BAR_W * brightness)
         if fill_w > 0:
@@ -71,19 +106,6 @@ class LedBrightnessScreen(Screen):
             )
 
         # Tick marks at each level
-        for lvl in _LEVELS[1:-1]:
-            tx = _BAR_X0 + int(_BAR_W * lvl)
-            draw.line([tx, _BAR_Y0 + 2, tx, _BAR_Y1 - 2], fill="#0a0a0a", width=1)
-
-        # Button hints
-        draw.text((10, 192), "X", font=hint_font, fill="#888888")
-        draw.text((30, 193), "dim", font=label_font, fill="#555555")
-
-        plus_label = "brighten"
-        plus_w = int(draw.textlength(plus_label, font=label_font))
-        hint_w = int(draw.textlength("Y", font=hint_font))
-        draw.text((WIDTH - 10 - plus_w - 6 - hint_w, 193), plus_label, font=label_font, fill="#555555")
-        draw.text((WIDTH - 10 - hint_w, 192), "Y", font=hint_font, fill="#888888")
+        img.paste(_TICKS, (_BAR_X0, _BAR_Y0), _TICKS)
 
-        self._draw_screen_dots(draw, state.get_screen_count(), state.get_current_screen())
         return img
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from PIL import Image
+from collections.abc import Hashable
+
+from PIL import Image, ImageDraw
 
 from ..config import MixedItem, ScreenConfig, SubscriptionConfig
-from ..state import SharedState
-from .base import ITEMS_Y0, ITEMS_Y1, WIDTH, Screen, cell_layout
+from ..state import StateSnapshot
+from .base import ITEMS_Y0, ITEMS_Y1, WIDTH, Screen, cell_fonts, cell_layout, compile_format
 
 # CO2 colour thresholds (shared logic with sensor_screen)
 _CO2_COLOURS = [
@@ -33,48 +35,70 @@ class MixedScreen(Screen):
         subscriptions: dict[str, SubscriptionConfig],
     ) -> None:
         super().__init__(config.name)
-        self._items: list[MixedItem] = config.items  # type: ignore[assignment]
+        self._items: tuple[MixedItem, ...] = config.items  # type: ignore[assignment]
         self._subs = subscriptions
-
-    def render(self, state: SharedState) -> Image.Image:
-        img, draw = self._new_image()
-        self._draw_header(draw)
-
         n = len(self._items)
-        if n == 0:
-            return img
+        self._cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH) if n else []
+        self._formatters = [compile_format(item.format) for item in self._items]
 
-        cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH)
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | cell_fonts(self._cells)
 
-        reading = state.get_sensor()
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        super()._draw_static(draw, state)
+        if not self._items:
+            return
+        for item, (x0, y0, x1, y1, featured) in zip(self._items, self._cells):
+            if item.source:
+                label = item.label or item.source
+            else:
+                sub = self._subs.get(item.subscription_id)
+                if sub is None:
+                    self._draw_missing_subscription(draw, x0, y0, item.subscription_id)
+                    continue
+                label = item.label or sub.label
+            self._draw_item_label(draw, x0, y0, x1, y1, featured, label)
+        self._draw_cell_separators(draw, self._cells)
+        self._draw_screen_dots(draw, state.screen_count, state.current_screen)
 
-        for item, (x0, y0, x1, y1, featured) in zip(self._items, cells):
+    def _item_values(self, state: StateSnapshot) -> list[tuple[str, str, str] | None]:
+        """(formatted text, unit, colour) per item; None where the subscription is undefined."""
+        reading = state.sensor
+        values: list[tuple[str, str, str] | None] = []
+        for item, fmt in zip(self._items, self._formatters):
             if item.source:
                 # --- sensor item ---
                 raw = getattr(reading, item.source, None)
-                text = self._format_value(raw, item.format)
                 colour = _co2_colour(raw) if item.source == "co2" else "#e8e8e8"
-                label = item.label or item.source
-                unit = item.unit
+                values.append((fmt(raw), item.unit, colour))
             else:
                 # --- MQTT item ---
                 sub = self._subs.get(item.subscription_id)
                 if sub is None:
-                    from .base import load_font
-                    ef = load_font(13)
-                    draw.text((x0 + 10, y0 + 4), item.subscription_id, font=ef, fill="#ff4444")
-                    draw.text((x0 + 10, y0 + 20), "no subscription", font=ef, fill="#ff4444")
+                    values.append(None)
                     continue
-                raw = state.get_mqtt(item.subscription_id)
+                raw = state.mqtt.get(item.subscription_id)
                 if raw is not None and sub.value_map:
                     raw = sub.value_map.get(str(raw), str(raw))
-                text = self._format_value(raw, item.format)
-                colour = "#e8e8e8"
-                label = item.label or sub.label
-                unit = item.unit or sub.unit
+                values.append(
+                    (fmt(raw), item.unit or sub.unit, "#e8e8e8")
+                )
+        return values
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        return (
+            self._static_key(state), self._header_signature(), tuple(self._item_values(state))
+        )
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
 
-            self._draw_item_cell(draw, x0, y0, x1, y1, featured, label, text, unit, colour)
+        values = self._item_values(state)
+        for value, (x0, y0, x1, y1, featured) in zip(values, self._cells):
+            if value is None:
+                continue   # error tile is part of the static template
+            text, unit, colour = value
+            self._draw_item_value(draw, x0, y0, x1, y1, featured, text, unit, colour)
 
-        self._draw_cell_separators(draw, cells)
-        self._draw_screen_dots(draw, state.get_screen_count(), state.get_current_screen())
         return img
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from PIL import Image
+from collections.abc import Hashable
+
+from PIL import Image, ImageDraw
 
 from ..config import MqttItem, ScreenConfig, SubscriptionConfig
-from ..state import SharedState
+from ..state import StateSnapshot
 from .base import (
     ITEMS_Y0, ITEMS_Y1, WIDTH,
-    Screen, cell_layout, load_font,
+    Screen, cell_fonts, cell_layout, compile_format,
 )
 
 
@@ -22,33 +24,56 @@ class MQTTScreen(Screen):
         subscriptions: dict[str, SubscriptionConfig],
     ) -> None:
         super().__init__(config.name)
-        self._items: list[MqttItem] = config.items  # type: ignore[assignment]
+        self._items: tuple[MqttItem, ...] = config.items  # type: ignore[assignment]
         self._subs = subscriptions
-
-    def render(self, state: SharedState) -> Image.Image:
-        img, draw = self._new_image()
-        self._draw_header(draw)
-
         n = len(self._items)
-        if n == 0:
-            return img
+        self._cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH) if n else []
+        self._formatters = [compile_format(item.format) for item in self._items]
 
-        cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH)
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | cell_fonts(self._cells)
 
-        for item, (x0, y0, x1, y1, featured) in zip(self._items, cells):
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        super()._draw_static(draw, state)
+        if not self._items:
+            return
+        for item, (x0, y0, x1, y1, featured) in zip(self._items, self._cells):
             sub = self._subs.get(item.subscription_id)
             if sub is None:
-                ef = load_font(13)
-                draw.text((x0 + 10, y0 + 4), item.subscription_id, font=ef, fill="#ff4444")
-                draw.text((x0 + 10, y0 + 20), "no subscription", font=ef, fill="#ff4444")
-                continue
+                self._draw_missing_subscription(draw, x0, y0, item.subscription_id)
+            else:
+                self._draw_item_label(draw, x0, y0, x1, y1, featured, sub.label)
+        self._draw_cell_separators(draw, self._cells)
+        self._draw_screen_dots(draw, state.screen_count, state.current_screen)
 
-            raw = state.get_mqtt(item.subscription_id)
+    def _item_values(self, state: StateSnapshot) -> list[str | None]:
+        """Formatted text for each item; None where the subscription is undefined."""
+        values: list[str | None] = []
+        for item, fmt in zip(self._items, self._formatters):
+            sub = self._subs.get(item.subscription_id)
+            if sub is None:
+                values.append(None)
+                continue
+            raw = state.mqtt.get(item.subscription_id)
             if raw is not None and sub.value_map:
                 raw = sub.value_map.get(str(raw), str(raw))
-            text = self._format_value(raw, item.format)
-            self._draw_item_cell(draw, x0, y0, x1, y1, featured, sub.label, text, sub.unit, "#e8e8e8")
+            values.append(fmt(raw))
+        return values
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        return (
+            self._static_key(state), self._header_signature(), tuple(self._item_values(state))
+        )
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
+
+        values = self._item_values(state)
+        for item, text, (x0, y0, x1, y1, featured) in zip(self._items, values, self._cells):
+            if text is None:
+                continue   # error tile is part of the static template
+            unit = self._subs[item.subscription_id].unit
+            self._draw_item_value(draw, x0, y0, x1, y1, featured, text, unit, "#e8e8e8")
 
-        self._draw_cell_separators(draw, cells)
-        self._draw_screen_dots(draw, state.get_screen_count(), state.get_current_screen())
         return img
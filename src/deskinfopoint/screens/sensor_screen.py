@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from PIL import Image
+from collections.abc import Hashable
+
+from PIL import Image, ImageDraw
 
 from ..config import ScreenConfig, SensorItem
-from ..state import SharedState
+from ..state import StateSnapshot
 from .base import (
     ITEMS_Y0, ITEMS_Y1, WIDTH,
-    Screen, cell_layout,
+    Screen, cell_fonts, cell_layout, compile_format,
 )
 
 # CO2-specific colour thresholds (ppm)
@@ -35,25 +37,46 @@ class SensorScreen(Screen):
 
     def __init__(self, config: ScreenConfig) -> None:
         super().__init__(config.name)
-        self._items: list[SensorItem] = config.items  # type: ignore[assignment]
-
-    def render(self, state: SharedState) -> Image.Image:
-        reading = state.get_sensor()
-        img, draw = self._new_image()
-        self._draw_header(draw)
-
+        self._items: tuple[SensorItem, ...] = config.items  # type: ignore[assignment]
         n = len(self._items)
-        if n == 0:
-            return img
+        self._cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH) if n else []
+        self._formatters = [compile_format(item.format) for item in self._items]
+
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | cell_fonts(self._cells)
 
-        cells = cell_layout(n, ITEMS_Y0, ITEMS_Y1, WIDTH)
+    def _draw_static(self, draw: ImageDraw.ImageDraw, state: StateSnapshot) -> None:
+        super()._draw_static(draw, state)
+        if not self._items:
+            return
+        for item, (x0, y0, x1, y1, featured) in zip(self._items, self._cells):
+            self._draw_item_label(draw, x0, y0, x1, y1, featured, item.label)
+        self._draw_cell_separators(draw, self._cells)
+        self._draw_screen_dots(draw, state.screen_count, state.current_screen)
 
-        for item, (x0, y0, x1, y1, featured) in zip(self._items, cells):
+    def _item_values(self, state: StateSnapshot) -> list[tuple[str, str]]:
+        """(formatted text, colour) for each item."""
+        reading = state.sensor
+        values = []
+        for item, fmt in zip(self._items, self._formatters):
             raw = getattr(reading, item.source, None)
-            text = self._format_value(raw, item.format)
             colour = _co2_colour(raw) if item.source == "co2" else "#e8e8e8"
-            self._draw_item_cell(draw, x0, y0, x1, y1, featured, item.label, text, item.unit, colour)
+            values.append((fmt(raw), colour))
+        return values
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        return (
+            self._static_key(state), self._header_signature(), tuple(self._item_values(state))
+        )
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
+
+        values = self._item_values(state)
+        for item, (text, colour), (x0, y0, x1, y1, featured) in zip(
+            self._items, values, self._cells
+        ):
+            self._draw_item_value(draw, x0, y0, x1, y1, featured, text, item.unit, colour)
 
-        self._draw_cell_separators(draw, cells)
-        self._draw_screen_dots(draw, state.get_screen_count(), state.get_current_screen())
         return img
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
+
 from PIL import Image
 
 from ..settings_defs import SETTINGS
-from ..state import NavMode, SharedState
-from .base import HEIGHT, ITEMS_Y0, ITEMS_Y1, WIDTH, Screen, load_font
+from ..state import NavMode, StateSnapshot
+from .base import HEIGHT, ITEMS_Y0, ITEMS_Y1, WIDTH, Screen, load_font, text_width
 
 
 class SettingsScreen(Screen):
@@ -18,12 +20,27 @@ class SettingsScreen(Screen):
     def __init__(self) -> None:
         super().__init__("Settings")
 
-    def render(self, state: SharedState) -> Image.Image:
-        img, draw = self._new_image()
-        self._draw_header(draw)
+    def _static_key(self, state: StateSnapshot) -> Hashable:
+        return None   # only the header is static; it never changes
+
+    def fonts(self) -> set[tuple[int, bool]]:
+        return super().fonts() | {(40, True), (11, False)}
+
+    def content_signature(self, state: StateSnapshot) -> Hashable:
+        nav_mode = state.nav_mode
+        cursor = state.settings_cursor
+        edit_val = state.edit_value if nav_mode == NavMode.EDIT else None
+        return (
+            self._header_signature(), nav_mode, cursor, edit_val,
+            tuple(defn.getter(state) for defn in SETTINGS),
+        )
+
+    def render(self, state: StateSnapshot, target: Image.Image | None = None) -> Image.Image:
+        img, draw = self._new_frame(state, target)
+        self._draw_header_status(draw)
 
-        nav_mode = state.get_nav_mode()
-        cursor = state.get_settings_cursor()
+        nav_mode = state.nav_mode
+        cursor = state.settings_cursor
         n = len(SETTINGS)
         row_h = (ITEMS_Y1 - ITEMS_Y0) // n
 
@@ -43,7 +60,7 @@ class SettingsScreen(Screen):
                 draw.rectangle([0, y0, WIDTH - 1, y1 - 1], fill="#0e1535")
 
             # Current value to display
-            val = state.get_edit_value() if is_edit else defn.getter(state)
+            val = state.edit_value if is_edit else defn.getter(state)
             val_text = f"{int(round(val * 100))}%"
 
             # Label
@@ -51,7 +68,7 @@ class SettingsScreen(Screen):
 
             # Value (right-aligned, yellow when editing)
             val_color = "#ffd700" if is_edit else "#e8e8e8"
-            val_w = int(draw.textlength(val_text, font=val_font))
+            val_w = text_width(40, True, val_text)
             draw.text((WIDTH - 16 - val_w, y0 + 25), val_text, font=val_font, fill=val_color)
 
             # Progress bar
@@ -76,7 +93,7 @@ class SettingsScreen(Screen):
             hint = "X▲  Y▼       A:confirm  B:cancel"
         else:
             hint = "X▲  Y▼  A:edit       B:exit"
-        hint_w = int(draw.textlength(hint, font=hint_font))
+        hint_w = text_width(11, False, hint)
         draw.text(((WIDTH - hint_w) // 2, HEIGHT - 12), hint, font=hint_font, fill="#405060")
 
         return img
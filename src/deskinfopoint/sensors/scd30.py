@@ -13,6 +13,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# adafruit_scd30 attributes _read_data() fills in; see _read_measurement().
+_CACHED_FIELDS = ("_co2", "_temperature", "_relative_humidity")
+
+_MAX_BACKOFF = 30.0   # seconds: longest sleep after repeated read errors
+_QUIET_AFTER = 3      # consecutive read errors after which tracebacks are no longer logged
+
+
+def _read_measurement(scd) -> tuple[float, float, float]:
+    """Return (co2, temperature, humidity) from one READ_MEASUREMENT transfer.
+
+    adafruit_scd30's CO2, temperature and relative_humidity properties each
+    poll data-ready first; the first one then reads the measurement block
+    and clears the flag, so the other two return cached values.  With the
+    caller's own data_available check a reading cost four data-ready polls
+    plus one block read.  Calling _read_data() directly and taking the
+    values it caches cuts that to one poll plus one block read.  These are
+    driver internals, so if any of them is missing the public properties
+    are used instead.
+    """
+    read_data = getattr(scd, "_read_data", None)
+    if read_data is None or not all(hasattr(scd, name) for name in _CACHED_FIELDS):
+        return scd.CO2, scd.temperature, scd.relative_humidity
+    read_data()
+    return scd._co2, scd._temperature, scd._relative_humidity
+
 
 class SCD30Sensor:
     """Reads CO2, temperature, and humidity from an Adafruit SCD-30 via I2C.
@@ -20,7 +45,8 @@ class SCD30Sensor:
     Runs in a dedicated daemon thread; polls the sensor at the configured
     measurement_interval and writes readings to SharedState.  If
     config.publish_topic is set, each reading is also published as JSON
-    to that MQTT topic.
+    to that MQTT topic.  Read errors back off exponentially, up to
+    _MAX_BACKOFF seconds between attempts.
     """
 
     def __init__(
@@ -34,17 +60,11 @@ class SCD30Sensor:
         self._state = state
         self._shutdown = shutdown
         self._mqtt = mqtt
-        self._thread = threading.Thread(
-            target=self._run, name="scd30", daemon=False
-        )
+        self._thread: threading.Thread | None = None   # not created if deps are missing
 
     def start(self) -> None:
-        self._thread.start()
-
-    def join(self) -> None:
-        self._thread.join()
-
-    def _run(self) -> None:
+        # Import here rather than in the thread, so missing dependencies are
+        # reported at startup and no thread is spawned just to exit.
         try:
             import board  # type: ignore[import-untyped]
             import busio  # type: ignore[import-untyped]
@@ -52,22 +72,39 @@ class SCD30Sensor:
         except ImportError as e:
             logger.error("SCD-30 dependencies not available: %s. Sensor disabled.", e)
             return
+        # Daemon: the thread only reads the sensor, so a hung I2C read must not
+        # keep the process alive.  Clean shutdown still joins it.
+        self._thread = threading.Thread(
+            target=self._run, args=(board, busio, adafruit_scd30), name="scd30", daemon=True
+        )
+        self._thread.start()
 
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, board, busio, adafruit_scd30) -> None:
+        # I2C init stays in the thread: it retries for up to a minute while the
+        # sensor powers up, which must not hold up the display and buttons.
+        interval = self._config.measurement_interval
+        offset = self._config.temperature_offset
+        altitude = self._config.altitude
+        shutdown = self._shutdown
         scd = None
         for attempt in range(1, 13):   # up to 12 attempts (~60 s)
             try:
                 i2c = busio.I2C(board.SCL, board.SDA, frequency=50000)
                 scd = adafruit_scd30.SCD30(i2c)
-                scd.measurement_interval = self._config.measurement_interval
-                scd.temperature_offset = self._config.temperature_offset
-                if self._config.altitude:
-                    scd.altitude = self._config.altitude
+                scd.measurement_interval = interval
+                scd.temperature_offset = offset
+                if altitude:
+                    scd.altitude = altitude
                 break
             except Exception as e:
                 logger.warning(
                     "SCD-30 init attempt %d/12 failed: %s — retrying in 5 s", attempt, e
                 )
-                if self._shutdown.wait(timeout=5):
+                if shutdown.wait(timeout=5):
                     return   # shutdown requested while waiting
 
         if scd is None:
@@ -76,30 +113,53 @@ class SCD30Sensor:
 
         logger.info(
             "SCD-30 initialised (interval=%ds, offset=%.1f°C, altitude=%dm)",
-            self._config.measurement_interval,
-            self._config.temperature_offset,
-            self._config.altitude,
+            interval, offset, altitude,
         )
 
-        poll_interval = max(2, self._config.measurement_interval)
-        while not self._shutdown.is_set():
+        poll_interval = max(2, interval)
+        update_sensor = self._state.update_sensor
+        topic = self._config.publish_topic
+        publish = self._mqtt.publish if self._mqtt and topic else None
+        not_ready_wait = max(0.5, poll_interval / 4)
+        consecutive_errors = 0
+        # Logging is configured once at startup, so the level check is hoisted.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        while not shutdown.is_set():
             try:
+                # Until a reading is ready, poll faster so it is picked up soon after.
+                delay = not_ready_wait
                 if scd.data_available:
-                    co2 = scd.CO2
-                    temp = scd.temperature
-                    rh = scd.relative_humidity
-                    self._state.update_sensor(co2=co2, temperature=temp, humidity=rh)
-                    logger.debug("SCD-30 read: CO2=%.0f ppm  T=%.1f°C  RH=%.0f%%", co2, temp, rh)
-                    if self._mqtt and self._config.publish_topic:
-                        payload = json.dumps({
-                            "co2": round(co2),
-                            "temperature": round(temp, 1),
-                            "humidity": round(rh, 1),
-                        })
-                        self._mqtt.publish(self._config.publish_topic, payload)
-            except Exception:
-                logger.exception("SCD-30 read error")
-
-            self._shutdown.wait(timeout=poll_interval)
+                    co2, temp, rh = _read_measurement(scd)
+                    update_sensor(co2=co2, temperature=temp, humidity=rh)
+                    if debug:
+                        logger.debug(
+                            "SCD-30 read: CO2=%.0f ppm  T=%.1f°C  RH=%.0f%%", co2, temp, rh
+                        )
+                    if publish is not None:
+                        payload = json.dumps(
+                            {
+                                "co2": round(co2),
+                                "temperature": round(temp, 1),
+                                "humidity": round(rh, 1),
+                            },
+                            separators=(",", ":"),
+                        )
+                        # QoS 0: the next reading supersedes a lost one within seconds.
+                        publish(topic, payload, qos=0)
+                    delay = poll_interval
+                consecutive_errors = 0
+            except Exception as e:
+                # Back off exponentially so a flaky bus is not hammered or spammed in the log.
+                consecutive_errors += 1
+                delay = min(poll_interval * 2 ** consecutive_errors, _MAX_BACKOFF)
+                if consecutive_errors < _QUIET_AFTER:
+                    logger.exception("SCD-30 read error")
+                else:
+                    logger.warning(
+                        "SCD-30 read error (%d in a row): %s — retrying in %.0f s",
+                        consecutive_errors, e, delay,
+                    )
+
+            shutdown.wait(timeout=delay)
 
         logger.info("SCD-30 sensor thread stopped")
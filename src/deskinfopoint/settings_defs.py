@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
-    from .state import SharedState
+    from .state import StateSnapshot
 
 
 @dataclass
@@ -13,7 +13,7 @@ class SettingDef:
     step: float
     min_val: float
     max_val: float
-    getter: Callable[["SharedState"], float]
+    getter: Callable[["StateSnapshot"], float]
 
 
 SETTINGS: list[SettingDef] = [
@@ -22,13 +22,13 @@ SETTINGS: list[SettingDef] = [
         step=0.1,
         min_val=0.05,
         max_val=1.0,
-        getter=lambda s: s.get_brightness(),
+        getter=lambda s: s.brightness,
     ),
     SettingDef(
         label="LED Brightness",
         step=0.1,
         min_val=0.0,
         max_val=1.0,
-        getter=lambda s: s.get_led_brightness(),
+        getter=lambda s: s.led_brightness,
     ),
 ]
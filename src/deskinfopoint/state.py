@@ -1,32 +1,65 @@
 from __future__ import annotations
 
+import itertools
 import threading
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from .config import NightModeConfig
 
 
+_MISSING = object()   # sentinel for "no MQTT value stored yet"
+
+
 class NavMode(Enum):
     DATA = "data"
     SETTINGS = "settings"
     EDIT = "edit"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorReading:
+    """One SCD30 measurement.  Immutable, so it is published by swapping the reference."""
     co2: float | None = None
     temperature: float | None = None
     humidity: float | None = None
-    timestamp: float = 0.0   # time.monotonic() of last successful read
+    timestamp: int = 0   # time.monotonic_ns() of last successful read
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """Immutable copy of everything a screen renders from, taken under one lock.
+
+    The render loop takes one per frame and hands it to the screen, so a
+    frame costs a single lock acquisition and is internally consistent.
+    """
+    version: int
+    nav_mode: NavMode
+    current_screen: int
+    screen_count: int
+    brightness: float
+    led_brightness: float
+    settings_cursor: int
+    edit_value: float
+    sensor: SensorReading
+    mqtt: Mapping[str, Any]
 
 
 class SharedState:
-    """Central thread-safe data bus for all application state."""
+    """Central thread-safe data bus for all application state.
+
+    Every write holds self._lock, because it must bump the version and wake
+    the change conditions in the same critical section.  Readers of a single
+    field skip the lock: each field is replaced by one attribute store, so
+    a read sees either the old value or the new one.  Reads that need several
+    fields to agree (snapshot(), snapshot_persistable()) still lock.
+    """
 
     def __init__(
         self,
@@ -37,14 +70,18 @@ class SharedState:
     ) -> None:
         self._lock = threading.Lock()
         self._sensor = SensorReading()
-        self._mqtt: dict[str, Any] = {}
+        self._mqtt: Mapping[str, Any] = MappingProxyType({})   # read-only view, replaced on write
         self._current_screen = 0
         self._screen_count = screen_count
         self._brightness: float = max(0.05, min(1.0, initial_brightness))
         self._led_brightness: float = max(0.0, min(1.0, initial_led_brightness))
         self._night_mode = night_mode
         self._night_wake_until: float = 0.0   # monotonic; 0 = not woken
-        self._version: int = 0  # incremented on every write; readers use this to skip redundant work
+        self._version: int = 0  # advanced on every write; readers use this to skip redundant work
+        self._version_counter = itertools.count(1)
+        self._persist_version: int = 0  # incremented only when a persisted field changes
+        self._persist_changed = threading.Condition(self._lock)  # notified on each increment
+        self._changed = threading.Condition(self._lock)  # notified on every _version change
         self._nav_mode: NavMode = NavMode.DATA
         self._settings_cursor: int = 0
         self._edit_value: float = 0.0
@@ -52,60 +89,132 @@ class SharedState:
     # --- Version (change detection) ---
 
     def get_version(self) -> int:
-        with self._lock:
+        return self._version   # one attribute load; always a value some write published
+
+    def wait_change(self, version: int, timeout: float) -> int:
+        """Block until the version differs from *version* or *timeout* elapses.
+
+        Returns the current version (equal to *version* on timeout).
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != version, timeout)
             return self._version
 
+    def wake_waiters(self) -> None:
+        """Wake every wait_change() caller, e.g. so threads notice shutdown promptly.
+
+        Safe to call from a signal handler.  Handlers run on the main thread,
+        which may already hold self._lock (HA prefetch at startup, the final
+        snapshot at shutdown), and a plain Lock cannot be re-acquired.  So the
+        lock is only tried; if it is busy, the waiters' own timeouts cover
+        the wake-up (render loop _IDLE_WAIT and LED _TICK_SOLID, both 1 s).
+        """
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._bump()
+        finally:
+            self._lock.release()
+
+    def _bump(self) -> None:
+        """Record a write.  Caller must hold self._lock (for the notify).
+
+        The new version comes from an itertools.count, whose C-level next()
+        cannot interleave with another increment, and is published with a
+        single attribute store.
+        """
+        self._version = next(self._version_counter)
+        self._changed.notify_all()
+
+    def snapshot(self) -> StateSnapshot:
+        with self._lock:
+            return StateSnapshot(
+                version=self._version,
+                nav_mode=self._nav_mode,
+                current_screen=self._current_screen,
+                screen_count=self._screen_count,
+                brightness=self._brightness,
+                led_brightness=self._led_brightness,
+                settings_cursor=self._settings_cursor,
+                edit_value=self._edit_value,
+                sensor=self._sensor,
+                mqtt=self._mqtt,
+            )
+
+    # --- Persisted fields (screen, brightness, LED brightness) ---
+
+    def wait_persist_change(self, version: int, timeout: float) -> int:
+        """Block until the persist version differs from *version* or *timeout* elapses.
+
+        Returns the current persist version (equal to *version* on timeout).
+        """
+        with self._persist_changed:
+            self._persist_changed.wait_for(lambda: self._persist_version != version, timeout)
+            return self._persist_version
+
+    def snapshot_persistable(self) -> tuple[int, float, float, int]:
+        """Return (screen, brightness, led_brightness, persist_version) under one lock."""
+        with self._lock:
+            return (
+                self._current_screen,
+                self._brightness,
+                self._led_brightness,
+                self._persist_version,
+            )
+
     # --- Screen navigation ---
 
     def get_screen_count(self) -> int:
         return self._screen_count  # immutable after construction
 
     def get_current_screen(self) -> int:
-        with self._lock:
-            return self._current_screen
+        return self._current_screen
 
     def next_screen(self) -> None:
-        with self._lock:
-            self._current_screen = (self._current_screen + 1) % self._screen_count
-            self._version += 1
+        self._step_screen(1)
 
     def prev_screen(self) -> None:
+        self._step_screen(-1)
+
+    def _step_screen(self, delta: int) -> None:
+        """Move *delta* screens, wrapping; one lock hold covers the move and both notifies."""
         with self._lock:
-            self._current_screen = (self._current_screen - 1) % self._screen_count
-            self._version += 1
+            self._current_screen = (self._current_screen + delta) % self._screen_count
+            self._bump()
+            self._persist_version += 1
+            self._persist_changed.notify_all()
 
     # --- Navigation mode ---
 
     def get_nav_mode(self) -> NavMode:
-        with self._lock:
-            return self._nav_mode
+        return self._nav_mode
 
     def enter_settings(self) -> None:
         with self._lock:
             self._nav_mode = NavMode.SETTINGS
             self._settings_cursor = 0
-            self._version += 1
+            self._bump()
 
     def exit_settings(self) -> None:
         with self._lock:
             self._nav_mode = NavMode.DATA
-            self._version += 1
+            self._bump()
 
     def get_settings_cursor(self) -> int:
-        with self._lock:
-            return self._settings_cursor
+        return self._settings_cursor
 
     def settings_move(self, direction: int) -> None:
         """direction: -1 = move cursor up, +1 = move cursor down."""
         from .settings_defs import SETTINGS
         with self._lock:
             self._settings_cursor = (self._settings_cursor + direction) % len(SETTINGS)
-            self._version += 1
+            self._bump()
 
     def enter_edit(self) -> None:
         """Begin editing the highlighted setting; captures its current value."""
         with self._lock:
-            # Access raw fields directly to avoid re-entrant lock (getters also lock)
+            # Read the fields under the same lock hold, so the value captured for
+            # editing matches the cursor position confirm_edit() will apply it to.
             if self._settings_cursor == 0:
                 current = self._brightness
             elif self._settings_cursor == 1:
@@ -114,11 +223,10 @@ class SharedState:
                 current = 0.0
             self._edit_value = current
             self._nav_mode = NavMode.EDIT
-            self._version += 1
+            self._bump()
 
     def get_edit_value(self) -> float:
-        with self._lock:
-            return self._edit_value
+        return self._edit_value
 
     def edit_step(self, direction: int) -> None:
         """direction: +1 = increase, -1 = decrease."""
@@ -129,7 +237,7 @@ class SharedState:
                 defn.min_val,
                 min(defn.max_val, round(self._edit_value + direction * defn.step, 2)),
             )
-            self._version += 1
+            self._bump()
 
     def confirm_edit(self) -> None:
         """Apply the edit value to the corresponding setting and return to list."""
@@ -141,51 +249,64 @@ class SharedState:
             elif cursor == 1:
                 self._led_brightness = max(0.0, min(1.0, round(val, 2)))
             self._nav_mode = NavMode.SETTINGS
-            self._version += 1
+            self._bump()
+            self._persist_version += 1
+            self._persist_changed.notify_all()
 
     def cancel_edit(self) -> None:
         """Discard the edit value and return to list."""
         with self._lock:
             self._nav_mode = NavMode.SETTINGS
-            self._version += 1
+            self._bump()
 
     # --- Sensor data ---
 
     def update_sensor(self, co2: float, temperature: float, humidity: float) -> None:
+        # Build the reading outside the lock; publishing it is one reference store.
+        reading = SensorReading(
+            co2=co2,
+            temperature=temperature,
+            humidity=humidity,
+            timestamp=time.monotonic_ns(),
+        )
         with self._lock:
-            self._sensor = SensorReading(
-                co2=co2,
-                temperature=temperature,
-                humidity=humidity,
-                timestamp=time.monotonic(),
-            )
-            self._version += 1
+            self._sensor = reading
+            self._bump()
 
     def get_sensor(self) -> SensorReading:
-        with self._lock:
-            return self._sensor   # dataclass is replaced atomically on each update
+        # No lock: readings are never mutated, only replaced by a single
+        # attribute store, so a reader sees either the old or the new one.
+        return self._sensor
 
     # --- Backlight brightness ---
 
     def get_brightness(self) -> float:
-        with self._lock:
-            return self._brightness
+        return self._brightness
 
     def set_brightness(self, value: float) -> None:
+        value = max(0.05, min(1.0, round(value, 2)))
         with self._lock:
-            self._brightness = max(0.05, min(1.0, round(value, 2)))
-            self._version += 1
+            if value == self._brightness:
+                return   # unchanged: no re-render, no state-file write
+            self._brightness = value
+            self._bump()
+            self._persist_version += 1
+            self._persist_changed.notify_all()
 
     # --- LED brightness ---
 
     def get_led_brightness(self) -> float:
-        with self._lock:
-            return self._led_brightness
+        return self._led_brightness
 
     def set_led_brightness(self, value: float) -> None:
+        value = max(0.0, min(1.0, round(value, 2)))
         with self._lock:
-            self._led_brightness = max(0.0, min(1.0, round(value, 2)))
-            self._version += 1
+            if value == self._led_brightness:
+                return
+            self._led_brightness = value
+            self._bump()
+            self._persist_version += 1
+            self._persist_changed.notify_all()
 
     # --- Night mode ---
 
@@ -202,8 +323,7 @@ class SharedState:
             in_window = start <= now < end
         if not in_window:
             return False
-        with self._lock:
-            return time.monotonic() >= self._night_wake_until
+        return time.monotonic() >= self._night_wake_until
 
     def night_wake(self) -> None:
         """Temporarily wake from night mode sleep for the configured duration."""
@@ -211,19 +331,35 @@ class SharedState:
             return
         with self._lock:
             self._night_wake_until = time.monotonic() + self._night_mode.wake_duration
-            self._version += 1
+            self._bump()
 
     # --- MQTT values ---
 
     def update_mqtt(self, sub_id: str, value: Any) -> None:
+        # Copy-on-write: readers hold the old view, which is never mutated.
+        with self._lock:
+            if self._mqtt.get(sub_id, _MISSING) == value:
+                return   # retained messages and heartbeats often resend the same value
+            values = dict(self._mqtt)
+            values[sub_id] = value
+            self._mqtt = MappingProxyType(values)
+            self._bump()
+
+    def update_mqtt_many(self, values: Mapping[str, Any]) -> None:
+        """Store several MQTT values with one copy, one lock hold and one version bump."""
         with self._lock:
-            self._mqtt[sub_id] = value
-            self._version += 1
+            current = self._mqtt
+            changed = {k: v for k, v in values.items() if current.get(k, _MISSING) != v}
+            if not changed:
+                return
+            merged = dict(current)
+            merged.update(changed)
+            self._mqtt = MappingProxyType(merged)
+            self._bump()
 
     def get_mqtt(self, sub_id: str) -> Any:
-        with self._lock:
-            return self._mqtt.get(sub_id)
+        return self._mqtt.get(sub_id)
 
-    def get_all_mqtt(self) -> dict[str, Any]:
-        with self._lock:
-            return dict(self._mqtt)
+    def get_all_mqtt(self) -> Mapping[str, Any]:
+        """Return a read-only view of every MQTT value.  It never changes; no copy is made."""
+        return self._mqtt